@@ -0,0 +1,84 @@
+"""
+Compare the brute force, spatial grid and batched numpy collision passes.
+
+Run from the repo root:
+    python -m benchmarks.bench_collisions
+"""
+
+import random
+import timeit
+
+from src.core.circleshape import CircleShape
+from src.core.collisions import BroadPhase, batch_hits
+from src.utils.constants import (
+    ASTEROID_KINDS,
+    ASTEROID_MIN_RADIUS,
+    BULLET_RADIUS,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+)
+
+ASTEROID_COUNTS = (50, 200, 1000)
+SHOT_COUNTS = (10, 100)
+MODES = ("brute", "grid", "kernel")
+
+
+def scatter(count, radius):
+    return [
+        CircleShape(
+            random.uniform(0, SCREEN_WIDTH), random.uniform(0, SCREEN_HEIGHT), radius()
+        )
+        for _ in range(count)
+    ]
+
+
+def collision_pass(mode, asteroids, shots):
+    if mode == "kernel":
+        return batch_hits(asteroids, shots)
+    broad_phase = BroadPhase(mode)
+    broad_phase.rebuild(shots)
+    return broad_phase.hits(asteroids)
+
+
+def main():
+    random.seed(0)
+    print(
+        f"{'asteroids':>9} {'shots':>6} {'hits':>5} "
+        f"{'brute ms':>9} {'grid ms':>8} {'kernel ms':>10}"
+    )
+    for asteroid_count in ASTEROID_COUNTS:
+        for shot_count in SHOT_COUNTS:
+            asteroids = scatter(
+                asteroid_count,
+                lambda: ASTEROID_MIN_RADIUS * random.randint(1, ASTEROID_KINDS),
+            )
+            shots = scatter(shot_count, lambda: BULLET_RADIUS)
+
+            timings = {}
+            hit_sets = {}
+            for mode in MODES:
+                hit_sets[mode] = collision_pass(mode, asteroids, shots)
+                timings[mode] = (
+                    min(
+                        timeit.repeat(
+                            lambda: collision_pass(mode, asteroids, shots),
+                            number=10,
+                            repeat=3,
+                        )
+                    )
+                    / 10
+                )
+
+            for mode in MODES:
+                if hit_sets[mode] != hit_sets["brute"]:
+                    raise SystemExit(f"{mode} and brute force hit sets differ")
+
+            print(
+                f"{asteroid_count:>9} {shot_count:>6} {len(hit_sets['grid']):>5} "
+                f"{timings['brute'] * 1000:>9.3f} {timings['grid'] * 1000:>8.3f} "
+                f"{timings['kernel'] * 1000:>10.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Per-frame HUD cost, rebuilding fonts every frame vs the cached Hud.
+
+Run from the repo root:
+    python -m benchmarks.bench_hud
+"""
+
+import os
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from pygame import Vector2
+
+from src.core.hud import Hud
+from src.utils.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+
+FRAMES = 500
+
+
+def legacy_hud(screen, score, lives):
+    """Score and lives the way Player drew them before the Hud"""
+    font = pygame.font.Font(None, 36)
+    score_text = font.render(f"Score: {score}", True, "white")
+    screen.blit(score_text, score_text.get_rect(center=(SCREEN_WIDTH // 2, 50)))
+
+    for i in range(lives):
+        pos = Vector2(30 + i * 30, 30)
+        forward = Vector2(0, -1).rotate(0) * 10
+        right = Vector2(0, -1).rotate(90) * 10 / 1.5
+        points = [pos + forward, pos - forward - right, pos - forward + right]
+        pygame.draw.polygon(screen, "red", points, 2)
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    hud = Hud()
+
+    def cached_hud(screen, score, lives):
+        hud.draw_score(screen, score)
+        hud.draw_lives(screen, lives)
+
+    print(f"{'hud':>7} {'us/frame':>9}")
+    for name, draw in (("legacy", legacy_hud), ("cached", cached_hud)):
+        # score changes every 50 frames, roughly a hit per second
+        elapsed = timeit.timeit(
+            lambda: [draw(screen, frame // 50 * 100, 5) for frame in range(FRAMES)],
+            number=1,
+        )
+        print(f"{name:>7} {elapsed / FRAMES * 1e6:>9.1f}")
+    print(hud.stats())
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+CPU time spent by the game loop while playing, paused and game over.
+
+Runs the game's main() against the dummy video driver and drives it from a
+second thread with posted key events, sampling process CPU time over each
+phase. The old busy game over loop is measured the same way for reference.
+
+Run from the repo root:
+    python -m benchmarks.bench_idle
+"""
+
+import os
+import threading
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import main as game
+from src.core.game_state import GAME_OVER
+
+PHASE_SECONDS = 2.0
+
+
+def cpu_share(seconds):
+    """Fraction of one core this process used over the next seconds"""
+    cpu = time.process_time()
+    wall = time.perf_counter()
+    time.sleep(seconds)
+    return (time.process_time() - cpu) / (time.perf_counter() - wall)
+
+
+def press(key):
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+
+
+def drive(shares, game_states):
+    # let the window and first frames settle
+    time.sleep(1.0)
+    shares["playing"] = cpu_share(PHASE_SECONDS)
+
+    press(pygame.K_p)
+    shares["paused"] = cpu_share(PHASE_SECONDS)
+    press(pygame.K_p)
+    time.sleep(0.5)
+
+    # kill the player from here, the loop notices on its next frame
+    game_states[0].end_game()
+    press(pygame.K_F3)  # nudge the loop out of its frame wait
+    time.sleep(0.5)
+    shares["game over"] = cpu_share(PHASE_SECONDS)
+
+    pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+
+def legacy_game_over_wait(seconds):
+    """The old handle_game_over loop, spinning on pygame.event.get"""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        for _ in pygame.event.get():
+            pass
+
+
+def main():
+    shares = {}
+    game_states = []
+
+    # grab the GameState the game creates so the driver can end the game
+    init = game.Simulation.__init__
+
+    def capture(self, *args, **kwargs):
+        init(self, *args, **kwargs)
+        game_states.append(self.game_state)
+
+    game.Simulation.__init__ = capture
+    driver = threading.Thread(target=drive, args=(shares, game_states))
+    driver.start()
+    game.main()
+    driver.join()
+    game.Simulation.__init__ = init
+
+    if game_states[0].state != GAME_OVER:
+        raise SystemExit("game over phase was not reached")
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    waiter = threading.Thread(target=legacy_game_over_wait, args=(PHASE_SECONDS,))
+    waiter.start()
+    shares["legacy game over"] = cpu_share(PHASE_SECONDS)
+    waiter.join()
+    pygame.quit()
+
+    print(f"{'state':>17} {'cpu %':>6}")
+    for name, share in shares.items():
+        print(f"{name:>17} {share * 100:>6.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Asteroid vs asteroid physics cost as the asteroid count grows.
+
+Asteroids are scattered over an area that grows with their count, so the
+density (and the number of contacts per asteroid) stays that of a busy
+screen. Each frame moves every asteroid, wraps it around the area and runs
+AsteroidPhysics.step; only the step is timed and the best frame is kept,
+like timeit. An all-pairs numpy overlap test is timed next to it for
+reference. The sweep and prune contacts are
+checked against the all-pairs ones first, the run exits non-zero if they
+differ.
+
+Run from the repo root:
+    python -m benchmarks.bench_physics
+"""
+
+import math
+import random
+import time
+import timeit
+
+import numpy as np
+import pygame
+
+from src.core.circleshape import CircleShape
+from src.core.collisions import SweepAndPrune, overlap_pairs, positions_and_radii
+from src.core.physics import AsteroidPhysics
+from src.utils.constants import (
+    ASTEROID_CAP,
+    ASTEROID_KINDS,
+    ASTEROID_MIN_RADIUS,
+    FIXED_TIMESTEP,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+)
+
+ASTEROID_COUNTS = (250, 500, 1000, 2000, 4000)
+ALL_PAIRS_LIMIT = 2000  # the all-pairs arrays grow with the count squared
+FRAMES = 120
+
+
+def field(count, rng):
+    """count asteroids in an area holding ASTEROID_CAP per screen"""
+    scale = math.sqrt(count / ASTEROID_CAP)
+    width, height = SCREEN_WIDTH * scale, SCREEN_HEIGHT * scale
+    asteroids = []
+    for _ in range(count):
+        radius = ASTEROID_MIN_RADIUS * rng.randint(1, ASTEROID_KINDS)
+        asteroid = CircleShape(rng.uniform(0, width), rng.uniform(0, height), radius)
+        asteroid.velocity = pygame.Vector2(rng.uniform(40, 100), 0).rotate(
+            rng.uniform(0, 360)
+        )
+        asteroids.append(asteroid)
+    return asteroids, width, height
+
+
+def move(asteroids, width, height):
+    for asteroid in asteroids:
+        position = asteroid.position + asteroid.velocity * FIXED_TIMESTEP
+        asteroid.position = pygame.Vector2(position.x % width, position.y % height)
+
+
+def check_pairs(rng):
+    """Overlapping pairs from sweep and prune match the all-pairs test"""
+    asteroids, _, _ = field(1000, rng)
+    broad_phase = SweepAndPrune()
+    sprites, positions, radii = broad_phase.update(asteroids)
+    first, second = broad_phase.pairs(positions, radii)
+    distance = np.hypot(*(positions[first] - positions[second]).T)
+    touching = distance <= radii[first] + radii[second]
+    found = {
+        frozenset((sprites[i], sprites[j]))
+        for i, j in zip(first[touching].tolist(), second[touching].tolist())
+    }
+
+    positions, radii = positions_and_radii(asteroids)
+    expected = {
+        frozenset((asteroids[i], asteroids[j]))
+        for i, j in overlap_pairs(positions, radii, positions, radii).tolist()
+        if i < j
+    }
+    if found != expected:
+        raise SystemExit(
+            f"sweep and prune found {len(found)} pairs, all pairs {len(expected)}"
+        )
+
+
+def main():
+    rng = random.Random(0)
+    check_pairs(rng)
+
+    print(
+        f"{'asteroids':>9} {'step ms':>8} {'us/asteroid':>12} {'pairs':>6} "
+        f"{'contacts':>9} {'all-pairs ms':>13}"
+    )
+    for count in ASTEROID_COUNTS:
+        asteroids, width, height = field(count, rng)
+        physics = AsteroidPhysics()
+        physics.step(asteroids)  # first sort from scratch, not timed
+
+        step_times = []
+        candidates = contacts = 0
+        for _ in range(FRAMES):
+            move(asteroids, width, height)
+            start = time.perf_counter()
+            physics.step(asteroids)
+            step_times.append(time.perf_counter() - start)
+            candidates += physics.candidates
+            contacts += physics.contacts
+        step = min(step_times)
+
+        all_pairs = "-"
+        if count <= ALL_PAIRS_LIMIT:
+            positions, radii = positions_and_radii(asteroids)
+            best = min(
+                timeit.repeat(
+                    lambda: overlap_pairs(positions, radii, positions, radii),
+                    number=1,
+                    repeat=3,
+                )
+            )
+            all_pairs = f"{best * 1000:.3f}"
+
+        print(
+            f"{count:>9} {step * 1000:>8.3f} {step / count * 1e6:>12.2f} "
+            f"{candidates / FRAMES:>6.0f} {contacts / FRAMES:>9.1f} {all_pairs:>13}"
+        )
+
+
+if __name__ == "__main__":
+    main()
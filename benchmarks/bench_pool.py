@@ -0,0 +1,76 @@
+"""
+Split and draw storm with and without sprite pooling.
+
+Run from the repo root:
+    python -m benchmarks.bench_pool
+"""
+
+import gc
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src.core.asteroid import Asteroid
+from src.core.pool import SpritePool
+from src.core.shot import Shot
+from src.utils.constants import ASTEROID_MAX_RADIUS, SCREEN_HEIGHT, SCREEN_WIDTH
+from src.utils.texture_cache import texture_cache
+
+WAVES = 50
+ASTEROIDS_PER_WAVE = 10
+
+
+def storm(pooled, screen):
+    group = pygame.sprite.Group()
+    Asteroid.containers = [group]
+    Shot.containers = [group]
+    Asteroid.pool = (
+        SpritePool(Asteroid, key=lambda x, y, radius: radius) if pooled else None
+    )
+    Shot.pool = SpritePool(Shot) if pooled else None
+
+    random.seed(0)
+    collections = sum(stat["collections"] for stat in gc.get_stats())
+    start = time.perf_counter()
+    for _ in range(WAVES):
+        for _ in range(ASTEROIDS_PER_WAVE):
+            Asteroid.create(
+                random.uniform(0, SCREEN_WIDTH),
+                random.uniform(0, SCREEN_HEIGHT),
+                ASTEROID_MAX_RADIUS,
+            )
+            Shot.create(pygame.Vector2(0, 0), 0).kill()
+        # split everything down to nothing, drawing builds deformed surfaces
+        while group:
+            for asteroid in group.sprites():
+                asteroid.draw(screen)
+                asteroid.split()
+    elapsed = time.perf_counter() - start
+    collections = sum(stat["collections"] for stat in gc.get_stats()) - collections
+    return elapsed, collections
+
+
+def main():
+    pygame.init()
+    # keep noise generation out of the comparison
+    texture_cache.prewarm()
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    print(f"{'pooling':>8} {'total ms':>9} {'gc runs':>8}")
+    for pooled in (False, True):
+        elapsed, collections = storm(pooled, screen)
+        print(f"{str(pooled):>8} {elapsed * 1000:>9.1f} {collections:>8}")
+    print("asteroid pool:", Asteroid.pool.stats())
+    print("shot pool:", Shot.pool.stats())
+
+    Asteroid.pool = None
+    Shot.pool = None
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Cost of each asteroid detail level, and the governor holding a frame budget.
+
+The first table pins each level of quality_governor.LEVELS in turn and
+times building asteroids from scratch (noise texture plus warp, with the
+texture cache and bank bypassed), drawing a frame of textured asteroids and
+drawing a frame of outlines.
+
+The second part draws frames of a field too heavy for the budget with the
+governor adapting, then of a light field, and prints every decision it
+made plus the mean frame time spent at each level. The budget sits between
+the full and cheapest level's frame cost measured in the first part.
+
+Run from the repo root:
+    python -m benchmarks.bench_quality
+"""
+
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from src.core.asteroid import Asteroid
+from src.core.circleshape import CircleShape
+from src.utils.constants import ASTEROID_MAX_RADIUS, SCREEN_HEIGHT, SCREEN_WIDTH
+from src.utils.quality_governor import LEVELS, quality_governor
+from src.utils.rotation_atlas import rotation_atlas
+from src.utils.texture_cache import texture_cache
+from src.utils.utils import load_noise
+
+BUILDS = 40
+FIELD = 200
+FRAMES = 60
+HEAVY_FRAMES = 600
+LIGHT_FRAMES = 600
+
+
+def make_asteroids(count, rng):
+    return [
+        Asteroid(
+            rng.uniform(0, SCREEN_WIDTH),
+            rng.uniform(0, SCREEN_HEIGHT),
+            rng.choice((10, 20, ASTEROID_MAX_RADIUS)),
+        )
+        for _ in range(count)
+    ]
+
+
+def draw_frame(screen, asteroids):
+    screen.fill((0, 0, 0))
+    for asteroid in asteroids:
+        asteroid.update(1 / 60)
+        asteroid.draw(screen)
+
+
+def draw_outlines(screen, asteroids):
+    screen.fill((0, 0, 0))
+    for asteroid in asteroids:
+        CircleShape.draw(asteroid, screen)
+
+
+def per_frame(draw, screen, asteroids):
+    draw(screen, asteroids)  # warm up, fills the rotation atlas
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        draw(screen, asteroids)
+    return (time.perf_counter() - start) / FRAMES
+
+
+def level_costs(screen):
+    print(f"{'level':>5} {'build ms':>9} {'frame ms':>9} {'outline ms':>11}")
+    bank = texture_cache.bank
+    texture_cache.bank = None
+    load_noise()  # keep the import out of level 0's builds
+    frame_costs = []
+    for level in range(len(LEVELS)):
+        quality_governor.pin(level)
+        rng = random.Random(0)
+
+        texture_cache.clear()
+        start = time.perf_counter()
+        for asteroid in make_asteroids(BUILDS, rng):
+            asteroid.draw(screen)
+        build = (time.perf_counter() - start) / BUILDS
+
+        asteroids = make_asteroids(FIELD, rng)
+        frame = per_frame(draw_frame, screen, asteroids)
+        outline = per_frame(draw_outlines, screen, asteroids)
+        rotation_atlas.clear()
+        frame_costs.append(frame)
+        print(
+            f"{level:>5} {build * 1000:>9.3f} {frame * 1000:>9.3f} "
+            f"{outline * 1000:>11.3f}"
+        )
+    texture_cache.bank = bank
+    return frame_costs
+
+
+def governed(screen, budget):
+    # asteroids read the process-wide governor, so adapt that one
+    governor = quality_governor
+    governor.budget = budget
+    governor.pin(None)
+
+    rng = random.Random(1)
+    heavy = make_asteroids(FIELD, rng)
+    light = heavy[: FIELD // 4]
+    times = {}
+    for asteroids, frames in ((heavy, HEAVY_FRAMES), (light, LIGHT_FRAMES)):
+        for _ in range(frames):
+            level = governor.index
+            start = time.perf_counter()
+            draw_frame(screen, asteroids)
+            elapsed = time.perf_counter() - start
+            governor.frame(elapsed)
+            times.setdefault(level, []).append(elapsed)
+        print(f"{len(asteroids)} asteroids, ended at level {governor.index}")
+
+    print(f"budget {budget * 1000:.3f} ms")
+    print(f"{'frame':>6} {'from':>5} {'to':>3} {'mean ms':>8}")
+    for frame, old, new, mean in governor.decisions:
+        print(f"{frame:>6} {old:>5} {new:>3} {mean:>8.3f}")
+    print(f"{'level':>5} {'frames':>7} {'mean ms':>8}")
+    for level in sorted(times):
+        print(f"{level:>5} {len(times[level]):>7} {np.mean(times[level]) * 1000:>8.3f}")
+
+
+def main():
+    pygame.init()
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    frame_costs = level_costs(screen)
+    print()
+    governed(screen, (frame_costs[0] + frame_costs[-1]) / 2)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
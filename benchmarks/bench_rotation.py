@@ -0,0 +1,90 @@
+"""
+Compare exact per-frame rotation against the pre-rotated atlas.
+
+Run from the repo root:
+    python -m benchmarks.bench_rotation
+"""
+
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from src.core.asteroid import Asteroid
+from src.utils.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from src.utils.rotation_atlas import rotation_atlas
+
+COUNTS = (50, 200, 500)
+FRAMES = 120
+
+
+def make_asteroids(count):
+    asteroids = []
+    for _ in range(count):
+        asteroid = Asteroid(
+            random.uniform(0, SCREEN_WIDTH),
+            random.uniform(0, SCREEN_HEIGHT),
+            random.choice((10, 20, 30)),
+        )
+        asteroid.cached_surface = asteroid._build_deformed_surface()
+        asteroids.append(asteroid)
+    return asteroids
+
+
+def time_frames(screen, asteroids, mode):
+    Asteroid.rotation_mode = mode
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        screen.fill((0, 0, 0))
+        for asteroid in asteroids:
+            asteroid.update(1 / 60)
+            asteroid.draw(screen)
+    return (time.perf_counter() - start) / FRAMES
+
+
+def rotation_error(asteroids):
+    """Mean absolute RGB difference between exact and atlas frames"""
+    diffs = []
+    for asteroid in asteroids[:20]:
+        for angle in np.linspace(0, 360, 37):
+            exact = pygame.transform.rotate(asteroid.cached_surface, angle)
+            atlas = rotation_atlas.get(asteroid.cached_surface, angle)
+            size = max(exact.get_width(), atlas.get_width()) + 2
+            canvases = []
+            for frame in (exact, atlas):
+                canvas = pygame.Surface((size, size))
+                canvas.blit(frame, frame.get_rect(center=(size / 2, size / 2)))
+                canvases.append(pygame.surfarray.array3d(canvas).astype(int))
+            diffs.append(np.abs(canvases[0] - canvases[1]).mean())
+    return float(np.mean(diffs))
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    random.seed(0)
+
+    print(f"atlas buckets: {rotation_atlas.buckets}")
+    print(f"{'asteroids':>9} {'exact ms':>9} {'atlas ms':>9} {'speedup':>8}")
+    for count in COUNTS:
+        asteroids = make_asteroids(count)
+        exact = time_frames(screen, asteroids, "exact")
+        # first pass fills the atlas, second one is steady state
+        time_frames(screen, asteroids, "atlas")
+        atlas = time_frames(screen, asteroids, "atlas")
+        print(
+            f"{count:>9} {exact * 1000:>9.2f} {atlas * 1000:>9.2f} "
+            f"{exact / atlas:>7.1f}x"
+        )
+
+    print(f"mean abs pixel error: {rotation_error(asteroids):.2f}")
+    print(rotation_atlas.stats())
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
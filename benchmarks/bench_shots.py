@@ -0,0 +1,79 @@
+"""
+Per-shot polygon draws against one batched blits call.
+
+Run from the repo root:
+    python -m benchmarks.bench_shots
+"""
+
+import os
+import random
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from src.core.shot import Shot
+from src.utils.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+
+COUNTS = (50, 500, 5000)
+FRAMES = 20
+
+
+def draw_polygons(screen, shots):
+    for shot in shots:
+        shot.draw(screen)
+
+
+def draw_batched(screen, shots):
+    Shot.draw_batch(screen, shots)
+
+
+def lit_pixels(draw, shots):
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    draw(screen, shots)
+    return pygame.surfarray.array2d(screen) != 0
+
+
+def main():
+    pygame.init()
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    random.seed(0)
+
+    print(
+        f"{'shots':>6} {'polygon ms':>11} {'batched ms':>11} {'speedup':>8} {'diff px':>8}"
+    )
+    for count in COUNTS:
+        shots = [
+            Shot(
+                pygame.Vector2(
+                    random.uniform(0, SCREEN_WIDTH), random.uniform(0, SCREEN_HEIGHT)
+                ),
+                random.uniform(0, 360),
+            )
+            for _ in range(count)
+        ]
+
+        timings = {}
+        for name, draw in (("polygon", draw_polygons), ("batched", draw_batched)):
+            timings[name] = (
+                min(timeit.repeat(lambda: draw(screen, shots), number=FRAMES, repeat=3))
+                / FRAMES
+            )
+
+        # sprite blits land on whole pixels, polygons round each vertex
+        diff = np.count_nonzero(
+            lit_pixels(draw_polygons, shots) != lit_pixels(draw_batched, shots)
+        )
+        print(
+            f"{count:>6} {timings['polygon'] * 1000:>11.3f} "
+            f"{timings['batched'] * 1000:>11.3f} "
+            f"{timings['polygon'] / timings['batched']:>7.1f}x {diff:>8}"
+        )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
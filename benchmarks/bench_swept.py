@@ -0,0 +1,181 @@
+"""
+Shot hits caught by the overlap test and the swept test at long ticks.
+
+Each trial aims a shot at a small moving asteroid so that, moving in
+straight lines, their closest approach is a known distance at a known
+time. Half the trials pass within 90% of the sum of the radii (must hit),
+half pass beyond 110% (must miss). Both are then stepped at each dt and
+the first tick the overlap test (CircleShape.collision) or the swept test
+(CircleShape.sweep) reports a hit is recorded. The swept test has to get
+every trial right with a time of impact matching the analytic one, the
+run exits non-zero otherwise.
+
+The second table times both collision passes at 200 asteroids x 100 shots.
+
+Run from the repo root:
+    python -m benchmarks.bench_swept
+"""
+
+import math
+import random
+import timeit
+
+import pygame
+
+from benchmarks.bench_collisions import scatter
+from src.core.circleshape import CircleShape
+from src.core.collisions import BroadPhase, batch_hits, batch_swept_hits
+from src.utils.constants import (
+    ASTEROID_KINDS,
+    ASTEROID_MIN_RADIUS,
+    BULLET_RADIUS,
+    PLAYER_SHOT_SPEED,
+)
+
+TIMESTEPS = (1 / 60, 1 / 15, 1 / 5)
+TRIALS = 1000
+TRIAL_SECONDS = 1.5
+# dts the swept test is checked at, the overlap test is expected to miss
+CHECKED_TIMESTEPS = (1 / 15, 1 / 5)
+
+
+def trial(rng):
+    """
+    Asteroid and shot whose paths come closest at a known time and distance.
+
+    Returns the asteroid and shot as (position, velocity, radius) and the
+    analytic time they first touch, None for misses.
+    """
+    reach = ASTEROID_MIN_RADIUS + BULLET_RADIUS
+    hit = rng.random() < 0.5
+    miss_distance = reach * (rng.uniform(0, 0.9) if hit else rng.uniform(1.1, 2))
+    closest = rng.uniform(0.3, 1.0)  # seconds
+
+    asteroid_velocity = pygame.Vector2(rng.uniform(40, 100), 0).rotate(
+        rng.uniform(0, 360)
+    )
+    shot_velocity = pygame.Vector2(PLAYER_SHOT_SPEED, 0).rotate(rng.uniform(0, 360))
+    relative = shot_velocity - asteroid_velocity
+    # side step perpendicular to the relative path, the closest approach
+    side = relative.rotate(90).normalize() * miss_distance * rng.choice((-1, 1))
+
+    meeting = pygame.Vector2(rng.uniform(200, 600), rng.uniform(200, 500))
+    asteroid = (meeting - asteroid_velocity * closest, asteroid_velocity)
+    shot = (meeting + side - shot_velocity * closest, shot_velocity)
+
+    impact = None
+    if hit:
+        impact = closest - math.sqrt(reach**2 - miss_distance**2) / relative.length()
+    return (*asteroid, ASTEROID_MIN_RADIUS), (*shot, BULLET_RADIUS), impact
+
+
+def body(position, velocity, radius):
+    shape = CircleShape(position.x, position.y, radius)
+    shape.velocity = velocity
+    return shape
+
+
+def first_hit(asteroid, shot, dt, swept):
+    """Time of the first hit found stepping at dt, None if none was"""
+    asteroid = body(*asteroid)
+    shot = body(*shot)
+    for tick in range(math.ceil(TRIAL_SECONDS / dt)):
+        asteroid.position += asteroid.velocity * dt
+        shot.position += shot.velocity * dt
+        if swept:
+            time = asteroid.sweep(shot, dt)
+            if time is not None:
+                return tick * dt + time
+        elif asteroid.collision(shot):
+            return (tick + 1) * dt
+    return None
+
+
+def detection():
+    rng = random.Random(0)
+    trials = [trial(rng) for _ in range(TRIALS)]
+    hits = sum(impact is not None for _, _, impact in trials)
+    failures = []
+
+    print(f"{TRIALS} trials, {hits} hits")
+    print(f"{'dt':>6} {'overlap':>8} {'swept':>6} {'false':>6} {'toi error':>10}")
+    for dt in TIMESTEPS:
+        found = {False: 0, True: 0}
+        false_hits = {False: 0, True: 0}
+        worst_error = 0.0
+        for asteroid, shot, impact in trials:
+            for swept in (False, True):
+                time = first_hit(asteroid, shot, dt, swept)
+                if time is None:
+                    continue
+                if impact is None:
+                    false_hits[swept] += 1
+                    continue
+                found[swept] += 1
+                if swept:
+                    worst_error = max(worst_error, abs(time - impact))
+
+        print(
+            f"1/{round(1 / dt):<4} {found[False]:>8} {found[True]:>6} "
+            f"{false_hits[True]:>6} {worst_error:>10.2e}"
+        )
+        if dt in CHECKED_TIMESTEPS and (
+            found[True] != hits or false_hits[True] or worst_error > 1e-9
+        ):
+            failures.append(dt)
+    return failures
+
+
+def cost():
+    random.seed(0)
+    asteroids = scatter(
+        200, lambda: ASTEROID_MIN_RADIUS * random.randint(1, ASTEROID_KINDS)
+    )
+    shots = scatter(100, lambda: BULLET_RADIUS)
+    for asteroid in asteroids:
+        asteroid.velocity = pygame.Vector2(random.uniform(40, 100), 0).rotate(
+            random.uniform(0, 360)
+        )
+    for shot in shots:
+        shot.velocity = pygame.Vector2(PLAYER_SHOT_SPEED, 0).rotate(
+            random.uniform(0, 360)
+        )
+
+    def grid(swept, dt):
+        broad_phase = BroadPhase("grid")
+        broad_phase.rebuild(shots)
+        if swept:
+            return broad_phase.swept_hits(asteroids, dt)
+        return broad_phase.hits(asteroids)
+
+    passes = {
+        "grid overlap": lambda dt: grid(False, dt),
+        "grid swept": lambda dt: grid(True, dt),
+        "kernel overlap": lambda dt: batch_hits(asteroids, shots),
+        "kernel swept": lambda dt: batch_swept_hits(asteroids, shots, dt),
+    }
+    print()
+    print("200 asteroids x 100 shots, ms per pass")
+    print(f"{'pass':>15}" + "".join(f"{f'1/{round(1 / dt)}':>8}" for dt in TIMESTEPS))
+    for name, collision_pass in passes.items():
+        timings = [
+            min(timeit.repeat(lambda: collision_pass(dt), number=10, repeat=3)) / 10
+            for dt in TIMESTEPS
+        ]
+        print(f"{name:>15}" + "".join(f"{t * 1000:>8.3f}" for t in timings))
+
+    for dt in TIMESTEPS:
+        if passes["grid swept"](dt) != passes["kernel swept"](dt):
+            raise SystemExit(f"grid and kernel swept hits differ at dt {dt:.3f}")
+
+
+def main():
+    failures = detection()
+    cost()
+    if failures:
+        dts = ", ".join(f"1/{round(1 / dt)}" for dt in failures)
+        raise SystemExit(f"swept test missed or misplaced hits at dt {dts}")
+
+
+if __name__ == "__main__":
+    main()
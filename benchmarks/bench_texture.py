@@ -0,0 +1,115 @@
+"""
+Compare generate_asteroid_texture against the original per-pixel loop.
+
+Run from the repo root:
+    python -m benchmarks.bench_texture
+"""
+
+import os
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+from opensimplex import OpenSimplex
+
+from src.utils.utils import generate_asteroid_texture
+
+RADII = (10, 20, 30)
+SEEDS = (1, 7, 500, 1000)
+
+
+def legacy_generate_asteroid_texture(radius, seed=None):
+    """The original scalar implementation, kept as the reference"""
+    size = int(radius * 2)
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+
+    noise_gen = OpenSimplex(seed=seed)
+
+    center = radius
+    for x in range(size):
+        for y in range(size):
+            dx = x - center
+            dy = y - center
+            distance = np.sqrt(dx * dx + dy * dy)
+
+            if distance < radius:
+                noise_val = 0
+                amplitude = 1.0
+                frequency = 1.0
+
+                for _ in range(4):
+                    noise_val += amplitude * noise_gen.noise2(
+                        x * frequency * 0.1, y * frequency * 0.1
+                    )
+                    amplitude *= 0.5
+                    frequency *= 2
+
+                noise_val = (noise_val + 1) * 0.5
+                noise_val = noise_val * 0.8 + 0.2
+
+                base_color = 64
+                color_range = 160
+                color_val = int(base_color + noise_val * color_range)
+
+                edge_distance = distance / radius
+                if edge_distance < 0.8:
+                    alpha = 255
+                else:
+                    alpha = int(255 * (1.0 - (edge_distance - 0.8) / 0.2))
+
+                surface.set_at((x, y), (color_val, color_val, color_val, alpha))
+
+    return surface
+
+
+def surfaces_equal(a, b):
+    return (
+        a.get_size() == b.get_size()
+        and np.array_equal(pygame.surfarray.array3d(a), pygame.surfarray.array3d(b))
+        and np.array_equal(
+            pygame.surfarray.array_alpha(a), pygame.surfarray.array_alpha(b)
+        )
+    )
+
+
+def main():
+    pygame.init()
+
+    for radius in RADII:
+        for seed in SEEDS:
+            if not surfaces_equal(
+                legacy_generate_asteroid_texture(radius, seed),
+                generate_asteroid_texture(radius, seed),
+            ):
+                raise SystemExit(f"texture mismatch at radius={radius} seed={seed}")
+    print("pixel-identical for all radii/seeds")
+
+    print(f"{'radius':>6} {'legacy ms':>10} {'batched ms':>11} {'speedup':>8}")
+    for radius in RADII:
+        legacy = min(
+            timeit.repeat(
+                lambda: legacy_generate_asteroid_texture(radius, 42),
+                number=1,
+                repeat=3,
+            )
+        )
+        batched = (
+            min(
+                timeit.repeat(
+                    lambda: generate_asteroid_texture(radius, 42), number=5, repeat=3
+                )
+            )
+            / 5
+        )
+        print(
+            f"{radius:>6} {legacy * 1000:>10.2f} {batched * 1000:>11.2f} "
+            f"{legacy / batched:>7.1f}x"
+        )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Compare per-sprite update() calls against one World.step().
+
+Run from the repo root:
+    python -m benchmarks.bench_world
+"""
+
+import os
+import random
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src.core.asteroid import Asteroid
+from src.core.shot import Shot
+from src.core.world import World
+from src.utils.constants import ASTEROID_MIN_RADIUS, SCREEN_HEIGHT, SCREEN_WIDTH
+
+COUNTS = (100, 1000, 5000)
+
+
+def populate(count, world):
+    Asteroid.world = world
+    Shot.world = world
+    group = pygame.sprite.Group()
+    Asteroid.containers = [group]
+    Shot.containers = [group]
+    for i in range(count):
+        position = pygame.Vector2(
+            random.uniform(0, SCREEN_WIDTH), random.uniform(0, SCREEN_HEIGHT)
+        )
+        if i % 4:
+            asteroid = Asteroid(position.x, position.y, ASTEROID_MIN_RADIUS)
+            asteroid.velocity = pygame.Vector2(random.uniform(-100, 100), 0)
+        else:
+            Shot(position, random.uniform(0, 360))
+    return group
+
+
+def main():
+    pygame.init()
+    random.seed(0)
+    dt = 1 / 60
+
+    print(f"{'entities':>8} {'update() ms':>12} {'step() ms':>10} {'speedup':>8}")
+    for count in COUNTS:
+        group = populate(count, None)
+        per_sprite = min(timeit.repeat(lambda: group.update(dt), number=1, repeat=5))
+
+        world = World()
+        populate(count, world)
+        stepped = min(timeit.repeat(lambda: world.step(dt), number=1, repeat=5))
+
+        print(
+            f"{count:>8} {per_sprite * 1000:>12.3f} {stepped * 1000:>10.3f} "
+            f"{per_sprite / stepped:>7.1f}x"
+        )
+
+    Asteroid.world = None
+    Shot.world = None
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+"""
+Headless benchmark suite with JSON baselines and a regression check.
+
+Every scenario times one operation at a time and reports ops/sec and
+p50/p95/p99 latency. --save writes the results as the baseline, later runs
+fail when a scenario's ops/sec drops more than --tolerance below it.
+
+Run from the repo root:
+    python -m benchmarks.suite --save
+    python -m benchmarks.suite
+    python -m benchmarks.suite --only collisions frame
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from benchmarks.bench_collisions import collision_pass, scatter
+from benchmarks.bench_physics import field, move
+from main import draw_state
+from src.core.asteroid import Asteroid
+from src.core.controls import ScriptedInput, spin_and_fire
+from src.core.physics import AsteroidPhysics
+from src.core.replay import InputLog
+from src.core.simulation import Simulation, initialize_sprite_groups
+from src.utils.constants import (
+    ASTEROID_KINDS,
+    ASTEROID_MAX_RADIUS,
+    ASTEROID_MIN_RADIUS,
+    BULLET_RADIUS,
+    COLLISION_MODE,
+    FIXED_TIMESTEP,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+)
+from src.utils.quality_governor import LEVELS, quality_governor
+from src.utils.texture_cache import texture_cache
+from src.utils.utils import generate_asteroid_texture
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+TOLERANCE = 0.25
+
+RADII = tuple(ASTEROID_MIN_RADIUS * kind for kind in range(1, ASTEROID_KINDS + 1))
+ASTEROID_COUNTS = (50, 200, 1000)
+SHOT_COUNTS = (10, 100)
+FRAME_ENTITIES = (50, 200)
+PHYSICS_ASTEROIDS = 1000
+REPLAY_SECONDS = 30
+
+
+def random_position(rng):
+    return rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT)
+
+
+def texture(radius):
+    seeds = iter(range(1, 10**6))
+    return lambda: generate_asteroid_texture(radius, next(seeds)), 20
+
+
+def fresh_draws(banked):
+    """Draw a new asteroid per op with an empty texture cache"""
+    initialize_sprite_groups()
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    rng = random.Random(0)
+    bank = texture_cache.bank
+
+    def op():
+        # only this op goes without the bank, later scenarios keep it
+        texture_cache.bank = bank if banked else None
+        texture_cache.clear()
+        asteroid = Asteroid(*random_position(rng), ASTEROID_MAX_RADIUS)
+        asteroid.draw(screen)
+        asteroid.kill()
+        texture_cache.bank = bank
+
+    return op, 50
+
+
+def draw_cold():
+    """Fresh asteroid with the texture cache and bank bypassed, noise and surface built"""
+    return fresh_draws(banked=False)
+
+
+def draw_banked():
+    """
+    Fresh asteroid with an empty texture cache, its texture read from the bank.
+
+    Same as draw_cold when there is no up to date bank, see
+    python main.py --build-texture-bank.
+    """
+    return fresh_draws(banked=True)
+
+
+def draw_warm():
+    """Same asteroid redrawn at a new angle, everything already cached"""
+    initialize_sprite_groups()
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    asteroid = Asteroid(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, ASTEROID_MAX_RADIUS)
+    asteroid.draw(screen)
+
+    def op():
+        asteroid.rotation = (asteroid.rotation + 7) % 360
+        asteroid.draw(screen)
+
+    return op, 2000
+
+
+def triangle():
+    initialize_sprite_groups()
+    asteroid = Asteroid(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, ASTEROID_MAX_RADIUS)
+    return asteroid.triangle, 2000
+
+
+def collisions(asteroid_count, shot_count):
+    """The COLLISION_MODE pass the main loop runs, without applying hits"""
+    random.seed(0)
+    asteroids = scatter(
+        asteroid_count, lambda: ASTEROID_MIN_RADIUS * random.randint(1, ASTEROID_KINDS)
+    )
+    shots = scatter(shot_count, lambda: BULLET_RADIUS)
+    return lambda: collision_pass(COLLISION_MODE, asteroids, shots), 100
+
+
+def physics():
+    """Asteroids moved one frame and bounced off each other, at constant density"""
+    asteroids, width, height = field(PHYSICS_ASTEROIDS, random.Random(0))
+    solver = AsteroidPhysics()
+
+    def op():
+        move(asteroids, width, height)
+        solver.step(asteroids)
+
+    return op, 200
+
+
+def split_storm():
+    """Ten large asteroids split all the way down, drawing every piece"""
+    simulation = Simulation(seed=0)
+    group = simulation.sprite_groups["asteroid_group"]
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    rng = simulation.rng
+
+    def op():
+        for _ in range(10):
+            Asteroid.create(*random_position(rng), ASTEROID_MAX_RADIUS)
+        while group:
+            for asteroid in group.sprites():
+                asteroid.draw(screen)
+                asteroid.split()
+
+    return op, 10
+
+
+def frame(entities, level=0):
+    """One fixed step plus a full redraw with the given number of asteroids"""
+    quality_governor.pin(level)
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    simulation = Simulation(ScriptedInput(spin_and_fire), seed=0)
+    game_state = simulation.game_state
+    drawable = simulation.sprite_groups["drawable"]
+    rng = simulation.rng
+    for _ in range(entities):
+        velocity = pygame.Vector2(rng.uniform(40, 100), 0).rotate(rng.uniform(0, 360))
+        radius = ASTEROID_MIN_RADIUS * rng.randint(1, ASTEROID_KINDS)
+        simulation.asteroid_field.spawn(
+            radius, pygame.Vector2(random_position(rng)), velocity
+        )
+    # keep the player alive, deaths would reset the scene. Lives stay at
+    # their starting count so the HUD draws them as in a real game
+    game_state.player.hit = lambda: False
+
+    def op():
+        simulation.step(FIXED_TIMESTEP)
+        draw_state(game_state, screen, drawable)
+
+    return op, 300
+
+
+def replay():
+    """Per tick cost of replaying a recorded bot session, the standard workload"""
+    log = InputLog()
+    Simulation(ScriptedInput(spin_and_fire), seed=0, recorder=log).run(REPLAY_SECONDS)
+
+    simulation = Simulation(ScriptedInput(log.inputs(), loop=False), seed=log.seed)
+    dts = iter(log.dts)
+
+    def op():
+        if simulation.step(next(dts)):
+            simulation.game_state.reset_game()
+
+    # the warm up call takes the first tick
+    return op, len(log) - 1
+
+
+SCENARIOS = {f"texture_r{radius}": lambda r=radius: texture(r) for radius in RADII}
+SCENARIOS["draw_cold"] = draw_cold
+SCENARIOS["draw_banked"] = draw_banked
+SCENARIOS["draw_warm"] = draw_warm
+SCENARIOS["triangle"] = triangle
+for asteroid_count in ASTEROID_COUNTS:
+    for shot_count in SHOT_COUNTS:
+        SCENARIOS[f"collisions_{asteroid_count}x{shot_count}"] = (
+            lambda a=asteroid_count, s=shot_count: collisions(a, s)
+        )
+SCENARIOS[f"physics_{PHYSICS_ASTEROIDS}"] = physics
+SCENARIOS["split_storm"] = split_storm
+for entities in FRAME_ENTITIES:
+    SCENARIOS[f"frame_{entities}"] = lambda n=entities: frame(n)
+SCENARIOS[f"frame_{FRAME_ENTITIES[-1]}_lowest"] = lambda: frame(
+    FRAME_ENTITIES[-1], len(LEVELS) - 1
+)
+SCENARIOS["replay"] = replay
+
+
+def measure(setup):
+    """Time each op of a scenario after one warm up call"""
+    op, ops = setup()
+    op()
+    latencies = np.empty(ops)
+    for i in range(ops):
+        start = time.perf_counter()
+        op()
+        latencies[i] = time.perf_counter() - start
+
+    p50, p95, p99 = np.percentile(latencies * 1000, [50, 95, 99])
+    return {
+        "ops": ops,
+        "ops_per_sec": float(ops / latencies.sum()),
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+    }
+
+
+def regressions(results, baseline, tolerance):
+    """Scenarios whose ops/sec fell more than tolerance below the baseline"""
+    slower = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        ratio = result["ops_per_sec"] / expected["ops_per_sec"]
+        if ratio < 1 - tolerance:
+            slower.append((name, ratio))
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Asteroids benchmark suite")
+    parser.add_argument(
+        "--only", nargs="+", help="run scenarios whose name starts with these"
+    )
+    parser.add_argument("--baseline", default=BASELINE, help="baseline JSON path")
+    parser.add_argument(
+        "--save", action="store_true", help="write this run as the baseline"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=TOLERANCE,
+        help="allowed ops/sec drop against the baseline, 0.25 = 25%%",
+    )
+    args = parser.parse_args()
+
+    names = [
+        name
+        for name in SCENARIOS
+        if not args.only or any(name.startswith(prefix) for prefix in args.only)
+    ]
+
+    pygame.init()
+    print(f"{'scenario':>20} {'ops/sec':>10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    results = {}
+    for name in names:
+        # full detail unless the scenario pins another level
+        quality_governor.pin(0)
+        result = results[name] = measure(SCENARIOS[name])
+        print(
+            f"{name:>20} {result['ops_per_sec']:>10.1f} {result['p50_ms']:>8.3f} "
+            f"{result['p95_ms']:>8.3f} {result['p99_ms']:>8.3f}"
+        )
+    pygame.quit()
+
+    if args.save:
+        # keep entries for scenarios that were not run this time
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2)
+        print(f"baseline saved to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}, run with --save to create one")
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    slower = regressions(results, baseline, args.tolerance)
+    for name, ratio in slower:
+        print(f"REGRESSION {name}: {ratio:.0%} of baseline ops/sec")
+    if slower:
+        sys.exit(1)
+    print(f"all scenarios within {args.tolerance:.0%} of the baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,107 +1,340 @@
-import pygame
-from pygame import Vector2
+import time
 
-from src.core.asteroid import Asteroid
-from src.core.asteroid_field import AsteroidField
-from src.core.game_state import GameState
-from src.core.player import Player
-from src.core.shot import Shot
-from src.utils.constants import *
+# as early as possible, --startup-profile counts from here
+STARTED = time.perf_counter()
 
+import argparse
+import ast
+import os
 
-def initialize_sprite_groups():
-    """Initialize and return sprite groups used in the game"""
-    updatable = pygame.sprite.Group()
-    drawable = pygame.sprite.Group()
-    asteroid_group = pygame.sprite.Group()
-    shot_group = pygame.sprite.Group()
-
-    # Set up sprite containers
-    Player.containers = [updatable, drawable]
-    Shot.containers = [updatable, drawable, shot_group]
-    Asteroid.containers = [updatable, drawable, asteroid_group]
-    AsteroidField.containers = [updatable]
+import pygame
 
-    return updatable, drawable, asteroid_group, shot_group
+from src.core.asteroid import Asteroid
+from src.core.controls import KeyboardInput, ScriptedInput, spin_and_fire
+from src.core.game_state import PLAYING
+from src.core.renderer import DirtyRectRenderer, draw_sprites
+from src.core.replay import InputLog, replay, state_digest
+from src.core.simulation import Simulation
+from src.core.startup import Startup
+from src.utils.constants import *
+from src.utils.profiler import profiler
+from src.utils.quality_governor import LEVELS, quality_governor
+from src.utils.rotation_atlas import rotation_atlas
+from src.utils.texture_bank import build_texture_bank, texture_bank
+from src.utils.texture_builder import texture_builder
+from src.utils.texture_cache import texture_cache
 
 
 def draw_state(game_state, screen, drawable):
     # Drawing
     screen.fill((0, 0, 0))
+    Asteroid.deformed_rebuilds = 0
 
     # Draw all game objects
-    for sprite in drawable:
-        sprite.draw(screen, sprite.triangle())
+    with profiler.phase("draw_sprites"):
+        draw_sprites(screen, drawable, game_state.sprite_groups["shot_group"])
 
     # Draw UI elements
-    game_state.player.draw_score(screen)
-    game_state.player.draw_lives(screen)
-    pygame.display.flip()
+    with profiler.phase("hud"):
+        game_state.hud.draw_score(screen, game_state.player.score)
+        game_state.hud.draw_lives(screen, game_state.player.lives)
+        profiler.draw_overlay(screen)
+
+    with profiler.phase("present"):
+        pygame.display.flip()
+
+
+def count_draw_stats(game_state):
+    """Report render side counters to the profiler"""
+    profiler.count("surfaces_built", Asteroid.deformed_rebuilds)
+    profiler.count("texture_cache_hits", texture_cache.hits)
+    profiler.count("texture_cache_misses", texture_cache.misses)
+    profiler.count("rotation_atlas_hits", rotation_atlas.hits)
+    profiler.count("hud_renders", game_state.hud.renders)
+    profiler.count("quality_level", quality_governor.index)
+    profiler.count("quality_changes", len(quality_governor.decisions))
+    if Asteroid.async_textures or texture_builder.pending:
+        profiler.count("texture_queue_depth", texture_builder.pending)
 
 
-def main():
+def main(profile_out=None, seed=None, record=None, startup=None, startup_profile=False):
+    startup = startup or Startup(STARTED)
+    startup.begin()
     pygame.init()
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    startup.mark("window_open")
     pygame.display.set_caption("Asteroids")
     clock = pygame.time.Clock()
 
-    updatable, drawable, asteroid_group, shot_group = initialize_sprite_groups()
-    sprite_groups = {
-        "updatable": updatable,
-        "drawable": drawable,
-        "asteroid_group": asteroid_group,
-        "shot_group": shot_group,
-    }
+    if TEXTURE_CACHE_PREWARM:
+        texture_cache.prewarm()
 
     # Initialize game state and sprite groups
-    game_state = GameState(sprite_groups)
+    keyboard = KeyboardInput()
+    log = InputLog() if record else None
+    simulation = Simulation(keyboard, seed=seed, recorder=log)
+    game_state = simulation.game_state
+    drawable = simulation.sprite_groups["drawable"]
+    renderer = DirtyRectRenderer() if RENDER_MODE == "dirty" else None
 
     dt = 0
-
-    # need to instantiate so that objects
-    # are added to containers
-    asteroid_field = AsteroidField()
+    redraw = True
 
     while game_state.running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                game_state.running = False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    game_state.running = False
-                if event.key == pygame.K_SPACE:
-                    game_state.player.shoot()
+        if game_state.state != PLAYING:
+            # paused or game over, draw once and sleep until an event arrives
+            if redraw:
+                draw_state(game_state, screen, drawable)
+                game_state.show_idle_screen(screen)
+            redraw = game_state.handle_idle_event(pygame.event.wait())
 
-        # Skip updates if game is over or paused
-        if not game_state.is_game_over and not game_state.is_paused:
-            updatable.update(dt)
-            game_state.update_difficulty()
+            if game_state.state == PLAYING:
+                # don't hand the time spent idle to the simulation
+                clock.tick()
+                dt = 0
+                if renderer is not None:
+                    renderer.invalidate()
+            continue
 
-            for asteroid in asteroid_group:
-                if game_state.player.collision(asteroid):
-                    game_state.player.handle_collision(asteroid)
-                    if game_state.player.hit():
-                        draw_state(game_state, screen, drawable)
-                        game_state.handle_game_over(screen)
-                        break
+        profiler.begin_frame()
 
-                for shot in shot_group:
-                    if shot.collision(asteroid):
-                        game_state.player.increase_score(asteroid.radius)
-                        asteroid.split()
+        with profiler.phase("events"):
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    game_state.running = False
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        game_state.running = False
+                    if event.key == pygame.K_SPACE:
+                        keyboard.press_fire()
+                    if event.key == pygame.K_p:
+                        game_state.pause()
+                    if event.key == pygame.K_F3:
+                        profiler.toggle_overlay()
 
-        draw_state(game_state, screen, drawable)
+        if game_state.state == PLAYING:
+            with profiler.phase("simulation"):
+                if simulation.advance(dt):
+                    game_state.end_game()
+
+        if renderer is not None:
+            renderer.draw(game_state, screen, drawable)
+        else:
+            draw_state(game_state, screen, drawable)
+        count_draw_stats(game_state)
+        startup.frame_drawn()
+        if startup_profile and startup.textured:
+            game_state.running = False
+        profiler.end_frame()
+        redraw = True
 
         # control the frame rate
         # doing clock caps the frame rate at 60FPS so
         # game loop doesn't hog all the CPU/GPU
         dt = clock.tick(60) / 1000
+        # raw time leaves out the sleep, only the frame's own work counts
+        quality_governor.frame(clock.get_rawtime() / 1000)
 
+    if profile_out:
+        profiler.export(profile_out)
+    if profiler.enabled:
+        print(f"Quality: {quality_governor.stats()}")
+    if log is not None:
+        log.save(record)
+    texture_builder.shutdown()
+    if startup_profile:
+        print(startup.report())
     pygame.quit()
 
 
+def run_headless(
+    seconds, profile_out=None, seed=None, record=None, timestep=FIXED_TIMESTEP
+):
+    """Simulate without a window as fast as possible, driven by a bot script"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+
+    log = InputLog() if record else None
+    simulation = Simulation(
+        ScriptedInput(spin_and_fire), timestep, seed=seed, recorder=log
+    )
+    start = time.perf_counter()
+    game_overs = simulation.run(seconds)
+    elapsed = time.perf_counter() - start
+
+    print(f"Simulated {simulation.time:.1f}s in {elapsed:.2f}s wall clock")
+    print(f"Ticks per second: {simulation.ticks / elapsed:.0f}")
+    print(f"Speedup: {simulation.time / elapsed:.1f}x real time")
+    print(f"Game overs: {game_overs}")
+    print(f"Entities: {simulation.game_state.entity_counts()}")
+    if profiler.enabled:
+        print(f"Tick time (ms): {profiler.percentiles()}")
+    print(f"Seed: {simulation.seed}, state digest: {state_digest(simulation)}")
+    if profile_out:
+        profiler.export(profile_out)
+    if log is not None:
+        log.save(record)
+
+    pygame.quit()
+
+
+def run_replay(path, profile_out=None):
+    """Replay a recorded input log headless, the digest matches the recording"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+
+    log = InputLog.load(path)
+    start = time.perf_counter()
+    simulation = replay(log)
+    elapsed = time.perf_counter() - start
+
+    print(f"Replayed {len(log)} ticks in {elapsed:.2f}s wall clock")
+    print(f"Ticks per second: {simulation.ticks / elapsed:.0f}")
+    print(f"Seed: {simulation.seed}, state digest: {state_digest(simulation)}")
+    if profiler.enabled:
+        print(f"Tick time (ms): {profiler.percentiles()}")
+    if profile_out:
+        profiler.export(profile_out)
+
+    pygame.quit()
+
+
+def run_games(games, processes, seconds, seed, overrides, out):
+    """Play games headless bot games across processes, results go to out"""
+    from src.core.batch import game_configs, run_batch, save_results
+
+    configs = game_configs(games, seed or 0, seconds, overrides=overrides)
+    results = run_batch(configs, processes)
+    save_results(results, out)
+
+    print(f"Played {games} games on {results['processes']} processes")
+    print(f"Wall clock: {results['wall_seconds']:.2f}s")
+    print(f"Games per second: {results['games_per_second']:.2f}")
+    print(f"Summary: {results['summary']}")
+    print(f"Results written to {out}")
+
+
+def positive_seconds(text):
+    """argparse type for durations, which have to be above zero"""
+    seconds = float(text)
+    if not seconds > 0:
+        raise argparse.ArgumentTypeError(f"must be above 0, got {text}")
+    return seconds
+
+
+def parse_override(text):
+    """NAME=VALUE with VALUE a python literal, e.g. SPEED_INCREASE=0.3"""
+    name, _, value = text.partition("=")
+    return name, ast.literal_eval(value)
+
+
 if __name__ == "__main__":
-    print("Starting asteroids")
-    print("Screen width: ", SCREEN_WIDTH)
-    print("Screen Height: ", SCREEN_HEIGHT)
-    main()
+    startup = Startup(STARTED)
+    startup.mark("imports_done")
+
+    parser = argparse.ArgumentParser(description="Asteroids")
+    parser.add_argument(
+        "--headless", action="store_true", help="simulate without a window"
+    )
+    parser.add_argument(
+        "--seconds",
+        type=positive_seconds,
+        default=60.0,
+        help="simulated seconds to run headless",
+    )
+    parser.add_argument(
+        "--timestep",
+        type=positive_seconds,
+        default=FIXED_TIMESTEP,
+        help="seconds per headless tick, pair long ticks with CONTINUOUS_COLLISIONS",
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help="time frame phases, F3 toggles overlay"
+    )
+    parser.add_argument(
+        "--profile-out", help="write per-frame records to this .csv or .json file"
+    )
+    parser.add_argument("--seed", type=int, help="seed for all gameplay randomness")
+    parser.add_argument("--record", help="save every tick's input to this file")
+    parser.add_argument("--replay", help="replay an input log headless and exit")
+    parser.add_argument(
+        "--batch", type=int, metavar="GAMES", help="play GAMES headless bot games"
+    )
+    parser.add_argument(
+        "--processes", type=int, help="worker processes for --batch, default all cores"
+    )
+    parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        type=parse_override,
+        metavar="NAME=VALUE",
+        help="override a constant for --batch games",
+    )
+    parser.add_argument(
+        "--batch-out", default="batch_results.json", help="--batch results file"
+    )
+    parser.add_argument(
+        "--build-texture-bank",
+        action="store_true",
+        help="prebuild every asteroid texture into TEXTURE_BANK_PATH and exit",
+    )
+    parser.add_argument(
+        "--quality-level",
+        type=int,
+        choices=range(len(LEVELS)),
+        help="pin asteroid detail at this level (0 = full) instead of adapting",
+    )
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="report import, first frame and first textured asteroid times, then exit",
+    )
+    args = parser.parse_args()
+    # batch games step at FIXED_TIMESTEP, --timestep is only for --headless
+    tick = (
+        dict(args.set).get("FIXED_TIMESTEP", FIXED_TIMESTEP)
+        if args.batch
+        else args.timestep
+    )
+    if (args.batch or args.headless) and args.seconds < tick:
+        parser.error(f"--seconds must be at least one tick ({tick:g}s)")
+
+    if args.profile or args.profile_out:
+        profiler.enabled = True
+        profiler.show_overlay = True
+    if args.quality_level is not None:
+        quality_governor.pin(args.quality_level)
+
+    if args.build_texture_bank:
+        start = time.perf_counter()
+        path = build_texture_bank()
+        print(f"Texture bank written to {path} in {time.perf_counter() - start:.1f}s")
+        texture_bank.open()
+        print(texture_bank.stats())
+    elif args.batch:
+        run_games(
+            args.batch,
+            args.processes,
+            args.seconds,
+            args.seed,
+            dict(args.set),
+            args.batch_out,
+        )
+    elif args.replay:
+        run_replay(args.replay, args.profile_out)
+    elif args.headless:
+        run_headless(
+            args.seconds, args.profile_out, args.seed, args.record, args.timestep
+        )
+    else:
+        print("Starting asteroids")
+        print("Screen width: ", SCREEN_WIDTH)
+        print("Screen Height: ", SCREEN_HEIGHT)
+        main(
+            args.profile_out,
+            args.seed,
+            args.record,
+            startup,
+            args.startup_profile,
+        )
@@ -1,41 +1,134 @@
-import math
+import functools
 import random
 
 import numpy as np
 import pygame
 
 from src.core.circleshape import CircleShape
-from src.utils.constants import ASTEROID_MIN_RADIUS
-from src.utils.utils import generate_asteroid_texture
+from src.core.pool import Poolable
+from src.core.world import ASTEROID, WorldBody
+from src.utils.constants import (
+    ASTEROID_MIN_RADIUS,
+    ASTEROID_TEXTURE_SEEDS,
+    ASYNC_TEXTURES,
+    ROTATION_MODE,
+)
+from src.utils.quality_governor import quality_governor
+from src.utils.rotation_atlas import rotation_atlas
+from src.utils.texture_builder import texture_builder
+from src.utils.texture_cache import texture_cache
+from src.utils.utils import deform_texture, surface_from_arrays
+
+# samples of the radial profile used to cut the deformed surface
+PROFILE_SAMPLES = 360
+
+
+@functools.cache
+def unit_outline(points):
+    """Unit offsets around the circle, same as Vector2(0, -1).rotate(degrees)"""
+    angles = np.arange(points) / points * 2 * np.pi
+    return np.column_stack((np.sin(angles), -np.cos(angles)))
+
+
+def radial_profile(control_points, samples):
+    """
+    Asteroid.interpolate evaluated at t = i / samples for every i at once.
+
+    control_points must already have the first point repeated at the end.
+    """
+    control_points = np.asarray(control_points)
+    segment = np.arange(samples) / samples * (len(control_points) - 1)
+    i = segment.astype(int)
+    f = segment - i
+    f = f * f * (3 - 2 * f)
+    return control_points[i] * (1 - f) + control_points[i + 1] * f
+
+
+class Asteroid(Poolable, WorldBody, CircleShape):
+    world_kind = ASTEROID
+
+    # deformed surfaces built during the current frame, reset by draw_state
+    deformed_rebuilds = 0
+    # "exact" or "atlas", see ROTATION_MODE
+    rotation_mode = ROTATION_MODE
+    # build surfaces on texture_builder threads, see ASYNC_TEXTURES
+    async_textures = ASYNC_TEXTURES
+    # asteroids still to be built in the background whatever async_textures
+    # says, handed out by Startup for the first wave
+    async_first_wave = 0
+    # shape, spin, texture and split rolls, a Simulation swaps in its seeded one
+    rng = random
 
-
-class Asteroid(CircleShape):
     def __init__(self, x, y, radius):
         super().__init__(x, y, radius)
-        self.velocity = pygame.Vector2(0, 0)
 
         # Create fewer control points for smoother interpolation
         self.num_control_points = 8
+        self.cached_surface = None
+        # deformed surface of the previous life of a pooled asteroid,
+        # the next one is written into it when the size matches
+        self.spare_surface = None
+        self.pending_build = None
+        self.reset(x, y, radius)
+
+    def reset(self, x, y, radius):
+        """
+        (Re)initialize the asteroid with a new shape, texture and spin.
+
+        Makes the same rng draws whether the asteroid is new or pooled, so
+        pooling never changes a game. Pooled ones only keep their deformed
+        surface, as a buffer for the next one.
+        """
+        self.position = pygame.Vector2(x, y)
+        self.velocity = pygame.Vector2(0, 0)
+        self.radius = radius
+
         self.control_points = [
-            random.uniform(0.8, 1.2) for _ in range(self.num_control_points)
+            self.rng.uniform(0.8, 1.2) for _ in range(self.num_control_points)
         ]
 
         # add first point to end to wrap the interpolation around
         self.control_points.append(self.control_points[0])
 
+        # the shape never changes after this, so sample it once
+        # (outlines once per point count, see outline())
+        self.outlines = {}
+        self.radiuses = self.radius * radial_profile(
+            self.control_points, PROFILE_SAMPLES
+        )
+
         # Generate unique texture with surface caching
-        self.cached_surface = None
-        self.last_points = None
+        if self.cached_surface is not None:
+            self.spare_surface = self.cached_surface
         self._setup_texture()
 
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-30, 30)  # degrees per second
+        self.rotation = self.rng.uniform(0, 360)
+        self.rotation_speed = self.rng.uniform(-30, 30)  # degrees per second
+        self.attach_to_world()
+
+    def pool_key_args(self):
+        return (self.position.x, self.position.y, self.radius)
 
     def _setup_texture(self):
-        self.original_texture = generate_asteroid_texture(
-            self.radius, seed=random.randint(1, 1000)
-        )
+        # the seed is rolled now but the texture is only fetched when first
+        # drawn, so headless runs never pay for noise generation
+        self.texture_seed = self.rng.randint(1, ASTEROID_TEXTURE_SEEDS)
+        self._texture = None
         self.cached_surface = None
+        self.pending_build = None
+        self.async_build = self.async_textures
+        if not self.async_build and Asteroid.async_first_wave > 0:
+            Asteroid.async_first_wave -= 1
+            self.async_build = True
+
+    @property
+    def original_texture(self):
+        # textures are shared through the cache, never draw onto them
+        if self._texture is None:
+            self._texture = texture_cache.get(
+                self.radius, self.texture_seed, quality_governor.level["texture_scale"]
+            )
+        return self._texture
 
     def interpolate(self, t):
         """
@@ -57,94 +150,113 @@ class Asteroid(CircleShape):
 
         return self.control_points[i] * (1 - f) + self.control_points[i + 1] * f
 
+    def outline(self, points):
+        """Outline offsets from the center with the given number of points"""
+        outline = self.outlines.get(points)
+        if outline is None:
+            profile = self.radius * radial_profile(self.control_points, points)
+            outline = self.outlines[points] = unit_outline(points) * profile[:, None]
+        return outline
+
     def triangle(self):
-        # Return points for circle approximation
-        # Return points for drawing a polygon that looks like a circle
-        points = []
-        num_points = 32  # More points = smoother circle
-        for i in range(num_points):
-            t = i / num_points
-            angle = t * 2 * math.pi
-
-            # smoothly interpolated radius variation
-            varied_radius = self.radius * self.interpolate(t)
-            point = (
-                pygame.Vector2(0, -varied_radius).rotate(math.degrees(angle))
-                + self.position
-            )
-            points.append(point)
-        return points
+        # Return points for drawing a polygon that looks like a circle,
+        # as an (n, 2) array offset from the precomputed outline, n is
+        # picked by the quality governor
+        position = self.position
+        outline = self.outline(quality_governor.level["outline_points"])
+        return outline + (position.x, position.y)
 
     def update(self, dt):
         self.position += self.velocity * dt
         self.rotation += self.rotation_speed * dt
         self.rotation %= 360
 
+    def _deformed_surface(self, rgb, alpha):
+        """Surface for the deformed arrays, the spare one is reused if it fits"""
+        spare, self.spare_surface = self.spare_surface, None
+        if spare is None or spare.get_size() != alpha.shape:
+            return surface_from_arrays(rgb, alpha)
+        # the atlas holds frames rotated from the old pixels
+        rotation_atlas.discard(spare)
+        return surface_from_arrays(rgb, alpha, spare)
+
+    def _build_deformed_surface(self):
+        """
+        Warp the round texture into the asteroid's bumpy outline.
+
+        Only depends on control_points and radius, so it is built once per
+        asteroid in local coordinates and position only matters for the blit.
+        """
+        texture = self.original_texture
+        return self._deformed_surface(
+            *deform_texture(
+                pygame.surfarray.array3d(texture),
+                pygame.surfarray.array_alpha(texture),
+                self.radius,
+                self.radiuses,
+                quality_governor.warp_scale(self.radius),
+            )
+        )
+
+    def _collect_build(self):
+        """
+        Poll the background build, True once cached_surface is set.
+
+        The first call queues the build, handing over the cached texture
+        if there is one. A full queue just means trying again next frame.
+        """
+        if self.pending_build is None:
+            if texture_builder.full():
+                return False
+            texture_scale = quality_governor.level["texture_scale"]
+            texture = texture_cache.lookup(
+                self.radius, self.texture_seed, texture_scale
+            )
+            if texture is not None:
+                self._texture = texture
+                texture = (
+                    pygame.surfarray.array3d(texture),
+                    pygame.surfarray.array_alpha(texture),
+                )
+            self.pending_build = texture_builder.submit(
+                self.radius,
+                self.texture_seed,
+                self.radiuses,
+                texture,
+                texture_scale,
+                quality_governor.warp_scale(self.radius),
+            )
+        if self.pending_build is None or not self.pending_build.done():
+            return False
+
+        texture, deformed, texture_scale = self.pending_build.result()
+        self.pending_build = None
+        if self._texture is None:
+            self._texture = texture_cache.add(
+                self.radius,
+                self.texture_seed,
+                surface_from_arrays(*texture),
+                texture_scale,
+            )
+        self.cached_surface = self._deformed_surface(*deformed)
+        return True
+
     def draw(self, surface, points=None):
-        if points is None:
-            points = self.triangle()
-
-        if self.cached_surface is None or self.last_points != points:
-            # Create a surface for the deformed asteroid
-            # important to make asteroid slightly bigger, else
-            # surface interpolation cannot be done, and you will
-            # have square asteroids :(
-            size = int(self.radius * 2.4)
-
-            deformed = pygame.Surface((size, size), pygame.SRCALPHA)
-
-            # Calculate center of the surface
-            center = pygame.Vector2(size / 2, size / 2)
-
-            # precalculate angles and radiuses for the shape
-            angles = []
-            radiuses = []
-
-            for i in range(360):  # One degree steps
-                angle = math.radians(i)
-                t = angle / (2 * math.pi)
-                varied_radius = self.radius * self.interpolate(t)
-                angles.append(angle)
-                radiuses.append(varied_radius)
-
-            # Use numpy for faster array operations
-            x_coords = np.arange(size)
-            y_coords = np.arange(size)
-            xx, yy = np.meshgrid(x_coords, y_coords)
-
-            # Calculate positions relative to center
-            pos_x = xx - center.x
-            pos_y = yy - center.y
-            distances = np.sqrt(pos_x**2 + pos_y**2)
-            angles = np.arctan2(pos_y, pos_x) % (2 * np.pi)
-
-            # Map angles to pre-calculated radiuses
-            angle_indices = (angles * 180 / np.pi).astype(int)
-            varied_radiuses = np.array(radiuses)[angle_indices]
-
-            # Create mask for valid pixels
-            mask = distances <= varied_radiuses
-
-            # Apply texture only where mask is True
-            for x, y in np.argwhere(mask):
-                ratio = distances[y][x] / varied_radiuses[y][x]
-                normalized_x = int(pos_x[y][x] * ratio + self.radius)
-                normalized_y = int(pos_y[y][x] * ratio + self.radius)
-
-                if (
-                    0 <= normalized_x < self.original_texture.get_width()
-                    and 0 <= normalized_y < self.original_texture.get_height()
-                ):
-                    color = self.original_texture.get_at((normalized_x, normalized_y))
-                    deformed.set_at((x, y), color)
-
-            self.cached_surface = deformed
-            self.last_points = points.copy()
+        if self.cached_surface is None:
+            if not self.async_build and self.pending_build is None:
+                self.cached_surface = self._build_deformed_surface()
+            elif not self._collect_build():
+                # plain outline until the worker is done
+                return CircleShape.draw(self, surface)
+            Asteroid.deformed_rebuilds += 1
 
         # Rotate the deformed texture
-        rotated = pygame.transform.rotate(deformed, self.rotation)
+        if self.rotation_mode == "atlas" or quality_governor.level["atlas_rotation"]:
+            rotated = rotation_atlas.get(self.cached_surface, self.rotation)
+        else:
+            rotated = pygame.transform.rotate(self.cached_surface, self.rotation)
         rect = rotated.get_rect(center=self.position)
-        surface.blit(rotated, rect)
+        return surface.blit(rotated, rect)
 
     def split(self):
         # prevents multiple splitting
@@ -154,15 +266,20 @@ class Asteroid(CircleShape):
 
         self.kill()
 
+        # read everything before creating children, with pooling
+        # this asteroid can come straight back as one of them
+        position = self.position
+        velocity = self.velocity
+
         # random splitting
-        split_angle = random.uniform(20, 50)
+        split_angle = self.rng.uniform(20, 50)
         new_radius = self.radius - ASTEROID_MIN_RADIUS
 
-        asteroid_a = Asteroid(self.position.x, self.position.y, new_radius)
-        asteroid_b = Asteroid(self.position.x, self.position.y, new_radius)
+        asteroid_a = Asteroid.create(position.x, position.y, new_radius)
+        asteroid_b = Asteroid.create(position.x, position.y, new_radius)
 
-        new_angle_a = self.velocity.rotate(split_angle)
-        new_angle_b = self.velocity.rotate(-split_angle)
+        new_angle_a = velocity.rotate(split_angle)
+        new_angle_b = velocity.rotate(-split_angle)
 
         asteroid_a.velocity = new_angle_a * 1.2
         asteroid_b.velocity = new_angle_b * 1.2
@@ -32,12 +32,59 @@ class AsteroidField(pygame.sprite.Sprite):
         ],
     ]
 
-    def __init__(self):
+    def __init__(self, asteroid_group=None, policy=None, rng=random):
         pygame.sprite.Sprite.__init__(self, self.containers)
+        self.rng = rng
         self.spawn_timer = 0.0
+        self.asteroid_group = asteroid_group
+        self.policy = ASTEROID_LIFETIME_POLICY if policy is None else policy
+        self.evicted = 0
+
+    def enforce_lifetime(self):
+        """
+        Keep the asteroid count bounded, see ASTEROID_LIFETIME_POLICY.
+
+        Not part of update(), the simulation calls it once every asteroid
+        has moved for the tick, whichever backend moved them.
+        """
+        if self.asteroid_group is None:
+            return
+
+        # groups keep insertion order, so the first sprites are the oldest
+        excess = len(self.asteroid_group) - ASTEROID_CAP
+        for asteroid in self.asteroid_group.sprites()[: max(excess, 0)]:
+            asteroid.kill()
+            self.evicted += 1
+
+        if self.policy == "cap":
+            return
+
+        margin = ASTEROID_LIFETIME_MARGIN
+        for asteroid in self.asteroid_group:
+            position = asteroid.position
+            outside_x = position.x < -margin or position.x > SCREEN_WIDTH + margin
+            outside_y = position.y < -margin or position.y > SCREEN_HEIGHT + margin
+            if not (outside_x or outside_y):
+                continue
+
+            if self.policy == "despawn":
+                asteroid.kill()
+                self.evicted += 1
+                continue
+
+            # wrap around to the opposite side of the margin
+            if position.x < -margin:
+                position.x += SCREEN_WIDTH + 2 * margin
+            elif position.x > SCREEN_WIDTH + margin:
+                position.x -= SCREEN_WIDTH + 2 * margin
+            if position.y < -margin:
+                position.y += SCREEN_HEIGHT + 2 * margin
+            elif position.y > SCREEN_HEIGHT + margin:
+                position.y -= SCREEN_HEIGHT + 2 * margin
+            asteroid.position = position
 
     def spawn(self, radius, position, velocity):
-        asteroid = Asteroid(position.x, position.y, radius)
+        asteroid = Asteroid.create(position.x, position.y, radius)
         asteroid.velocity = velocity
 
     def update(self, dt):
@@ -46,10 +93,10 @@ class AsteroidField(pygame.sprite.Sprite):
             self.spawn_timer = 0
 
             # spawn a new asteroid at a random edge
-            edge = random.choice(self.edges)
-            speed = random.randint(40, 100)
+            edge = self.rng.choice(self.edges)
+            speed = self.rng.randint(40, 100)
             velocity = edge[0] * speed
-            velocity = velocity.rotate(random.randint(-30, 30))
-            position = edge[1](random.uniform(0, 1))
-            kind = random.randint(1, ASTEROID_KINDS)
+            velocity = velocity.rotate(self.rng.randint(-30, 30))
+            position = edge[1](self.rng.uniform(0, 1))
+            kind = self.rng.randint(1, ASTEROID_KINDS)
             self.spawn(ASTEROID_MIN_RADIUS * kind, position, velocity)
@@ -0,0 +1,224 @@
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.core.controls import InputState, ScriptedInput, spin_and_fire
+from src.core.replay import InputLog
+from src.core.simulation import Simulation
+from src.utils.constants import FIXED_TIMESTEP
+
+# bot scripts a batch game can be driven by, see run_game
+BOTS = {
+    "spin_and_fire": spin_and_fire,
+    "idle": lambda tick: InputState(),
+}
+
+
+# read once on import, by class attributes or the process-wide singletons
+# (texture_cache, profiler, quality_governor, ...); overriding them per game
+# would silently do nothing
+IMPORT_TIME_CONSTANTS = frozenset(
+    {
+        "ASYNC_TEXTURES",
+        "DIRTY_RECT_THRESHOLD",
+        "PROFILER_ENABLED",
+        "PROFILER_WINDOW",
+        "QUALITY_FRAME_BUDGET",
+        "QUALITY_LEVEL",
+        "QUALITY_RAISE_BELOW",
+        "QUALITY_WINDOW",
+        "ROTATION_ATLAS_BUCKETS",
+        "ROTATION_ATLAS_BUDGET",
+        "ROTATION_MODE",
+        "STARTUP_ASYNC_ASTEROIDS",
+        "TEXTURE_BANK",
+        "TEXTURE_BUILDER_QUEUE",
+        "TEXTURE_BUILDER_WORKERS",
+        "TEXTURE_CACHE_BUDGET",
+    }
+)
+
+
+def apply_overrides(overrides):
+    """
+    Set constants by name in src.utils.constants and every src module.
+
+    Modules copy constants into their globals on import, so each copy is
+    replaced. Everything a game builds reads its constants when it is
+    built, names in IMPORT_TIME_CONSTANTS are rejected with a ValueError
+    like unknown ones. Returns the previous values so they can be put back.
+    """
+    # check every name first so a bad one doesn't leave the rest applied
+    targets = {}
+    for name in overrides:
+        if name in IMPORT_TIME_CONSTANTS:
+            raise ValueError(f"{name} is only read on import, it can't be overridden")
+        targets[name] = [
+            module
+            for module_name, module in list(sys.modules.items())
+            if module_name.startswith("src.") and hasattr(module, name)
+        ]
+        if not targets[name]:
+            raise ValueError(f"unknown constant {name}")
+
+    previous = []
+    for name, value in overrides.items():
+        for module in targets[name]:
+            previous.append((module, name, getattr(module, name)))
+            setattr(module, name, value)
+    return previous
+
+
+def restore_overrides(previous):
+    for module, name, value in reversed(previous):
+        setattr(module, name, value)
+
+
+def _start_worker():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+    import pygame
+
+    pygame.init()
+
+
+def run_game(config):
+    """
+    Play one game headless until the player dies or max_seconds pass.
+
+    config is a dict with seed, max_seconds, overrides (constant name ->
+    value) and either bot (a BOTS name) or replay (an input log path).
+    Returns the outcome and per tick timing stats as a dict.
+    """
+    previous = apply_overrides(config.get("overrides", {}))
+    try:
+        return _play(config)
+    finally:
+        # pool workers run many games, don't leak into the next one
+        restore_overrides(previous)
+
+
+def _play(config):
+    if config.get("replay"):
+        log = InputLog.load(config["replay"])
+        source = ScriptedInput(log.inputs(), loop=False)
+        seed = log.seed
+    else:
+        source = ScriptedInput(BOTS[config.get("bot", "spin_and_fire")])
+        seed = config["seed"]
+
+    simulation = Simulation(source, seed=seed)
+    game_state = simulation.game_state
+    ticks = round(config["max_seconds"] / simulation.timestep)
+    tick_times = np.empty(ticks)
+    died = False
+
+    start = time.perf_counter()
+    for tick in range(ticks):
+        tick_start = time.perf_counter()
+        died = simulation.step(simulation.timestep)
+        tick_times[tick] = time.perf_counter() - tick_start
+        if died:
+            tick_times = tick_times[: tick + 1]
+            break
+    elapsed = time.perf_counter() - start
+
+    # a game can only end before its first tick when handed a config
+    # that game_configs would have refused
+    p50 = p95 = p99 = None
+    if len(tick_times):
+        p50, p95, p99 = (
+            float(p) for p in np.percentile(tick_times * 1000, [50, 95, 99])
+        )
+    return {
+        **config,
+        "seed": seed,
+        "game_over": died,
+        "score": game_state.player.score,
+        "survival_seconds": simulation.time,
+        "peak_entities": game_state.peak_entities,
+        "ticks": simulation.ticks,
+        "wall_seconds": elapsed,
+        "tick_p50_ms": p50,
+        "tick_p95_ms": p95,
+        "tick_p99_ms": p99,
+        "pid": os.getpid(),
+    }
+
+
+def game_configs(
+    games, first_seed=0, max_seconds=300.0, bot="spin_and_fire", overrides=None
+):
+    """
+    One config per game with consecutive seeds, everything else shared.
+
+    Raises ValueError when max_seconds is shorter than one tick.
+    """
+    timestep = (overrides or {}).get("FIXED_TIMESTEP", FIXED_TIMESTEP)
+    if not max_seconds >= timestep:
+        raise ValueError(
+            f"max_seconds must be at least one tick ({timestep:g}s), got {max_seconds}"
+        )
+    return [
+        {
+            "seed": first_seed + game,
+            "max_seconds": max_seconds,
+            "bot": bot,
+            "overrides": overrides or {},
+        }
+        for game in range(games)
+    ]
+
+
+def run_batch(configs, processes=None):
+    """
+    Run every config in its own game across a process pool.
+
+    Workers are spawned rather than forked so they start from a clean
+    interpreter without the parent's pygame state. Results come back in
+    config order with a summary over all games.
+    """
+    processes = processes or os.cpu_count()
+    start = time.perf_counter()
+    with ProcessPoolExecutor(
+        processes,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_start_worker,
+    ) as executor:
+        results = list(executor.map(run_game, configs))
+    elapsed = time.perf_counter() - start
+
+    scores = np.array([result["score"] for result in results])
+    survival = np.array([result["survival_seconds"] for result in results])
+    return {
+        "processes": processes,
+        "wall_seconds": elapsed,
+        "games_per_second": len(results) / elapsed,
+        "summary": {
+            "games": len(results),
+            "game_overs": sum(result["game_over"] for result in results),
+            "score_mean": float(scores.mean()),
+            "score_max": int(scores.max()),
+            "survival_mean_seconds": float(survival.mean()),
+            "peak_entities": max(result["peak_entities"] for result in results),
+            "tick_p95_ms_worst": max(
+                (
+                    result["tick_p95_ms"]
+                    for result in results
+                    if result["tick_p95_ms"] is not None
+                ),
+                default=None,
+            ),
+        },
+        "games": results,
+    }
+
+
+def save_results(results, path):
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
@@ -1,5 +1,7 @@
 import pygame
 
+from src.core.collisions import time_of_impact
+
 
 # Base class for game objects
 class CircleShape(pygame.sprite.Sprite):
@@ -14,14 +16,30 @@ class CircleShape(pygame.sprite.Sprite):
         self.velocity = pygame.Vector2(0, 0)
         self.radius = radius
 
-    def draw(self, screen, triangle):
-        pygame.draw.polygon(screen, color="white", points=triangle, width=2)
+    def draw(self, screen, triangle=None):
+        # return the touched area for the dirty rect renderer
+        if triangle is None:
+            triangle = self.triangle()
+        return pygame.draw.polygon(screen, color="white", points=triangle, width=2)
 
     def update(self, dt):
         pass
 
     def collision(self, object):
-        if self.position.distance_to(object.position) <= self.radius + object.radius:
+        # compare squared distances to skip the sqrt
+        reach = self.radius + object.radius
+        if self.position.distance_squared_to(object.position) <= reach * reach:
             return True
 
         return False
+
+    def sweep(self, object, dt):
+        """
+        Time of impact with object over the last dt seconds, None if none.
+
+        Both are assumed to have moved in a straight line at their current
+        velocity, so a fast object can't pass through this one unnoticed.
+        """
+        velocity = object.velocity - self.velocity
+        offset = object.position - self.position - velocity * dt
+        return time_of_impact(offset, velocity, self.radius + object.radius, dt)
@@ -0,0 +1,325 @@
+import math
+
+import numpy as np
+
+from src.utils.constants import ASTEROID_MAX_RADIUS, COLLISION_MODE
+
+
+class SpatialGrid:
+    """
+    Uniform grid spatial hash over sprite centers.
+
+    Cells are addressed by (floor(x / cell_size), floor(y / cell_size)) in a
+    dict, so sprites outside the screen still hash to a cell.
+    """
+
+    def __init__(self, cell_size=None):
+        self.cell_size = ASTEROID_MAX_RADIUS if cell_size is None else cell_size
+        self.cells = {}
+        self.max_radius = 0
+
+    def rebuild(self, sprites):
+        self.cells.clear()
+        self.max_radius = 0
+        for index, sprite in enumerate(sprites):
+            cell = (
+                math.floor(sprite.position.x / self.cell_size),
+                math.floor(sprite.position.y / self.cell_size),
+            )
+            # keep the insertion index so queries can return sprites in order
+            self.cells.setdefault(cell, []).append((index, sprite))
+            self.max_radius = max(self.max_radius, sprite.radius)
+
+    def query(self, position, radius):
+        """Return sprites whose circle may overlap the given one, in insertion order"""
+        reach = radius + self.max_radius
+        min_x = math.floor((position.x - reach) / self.cell_size)
+        max_x = math.floor((position.x + reach) / self.cell_size)
+        min_y = math.floor((position.y - reach) / self.cell_size)
+        max_y = math.floor((position.y + reach) / self.cell_size)
+
+        found = []
+        for cx in range(min_x, max_x + 1):
+            for cy in range(min_y, max_y + 1):
+                cell = self.cells.get((cx, cy))
+                if cell:
+                    found.extend(cell)
+
+        found.sort(key=lambda item: item[0])
+        return [sprite for _, sprite in found]
+
+
+class BroadPhase:
+    """
+    Picks which shots need a narrow phase test against each asteroid.
+
+    "brute" hands back every shot, "grid" only the ones in nearby cells of a
+    SpatialGrid rebuilt every tick. Both give the same hits because the
+    narrow phase (CircleShape.collision) is shared and shots keep their
+    insertion order.
+    """
+
+    def __init__(self, mode=None):
+        # the constant is read here, not bound as the default, so
+        # batch.apply_overrides reaches it
+        self.mode = COLLISION_MODE if mode is None else mode
+        self.grid = SpatialGrid()
+        self.shots = []
+        self.checks = 0  # narrow phase candidates handed out this tick
+
+    def rebuild(self, shots):
+        self.checks = 0
+        self.shots = list(shots)
+        if self.mode == "grid":
+            self.grid.rebuild(self.shots)
+
+    def candidates(self, asteroid, margin=0):
+        """Shots that may be within margin of touching the asteroid"""
+        if self.mode == "grid":
+            shots = self.grid.query(asteroid.position, asteroid.radius + margin)
+        else:
+            shots = self.shots
+        self.checks += len(shots)
+        return shots
+
+    def hits(self, asteroids):
+        """Return the (asteroid, shot) hits, using the first_hits rules"""
+        used = set()
+        found = []
+        for asteroid in asteroids:
+            for shot in self.candidates(asteroid):
+                if shot not in used and shot.collision(asteroid):
+                    used.add(shot)
+                    found.append((asteroid, shot))
+                    break
+        return found
+
+    def swept_hits(self, asteroids, dt):
+        """Return the (asteroid, shot) hits over the last dt seconds, see earliest_hits"""
+        # shots that touched an asteroid during the tick ended up at most
+        # this much further away from it than the sum of their radii
+        shot_speed = max((shot.velocity.length() for shot in self.shots), default=0)
+        impacts = []
+        for asteroid in asteroids:
+            margin = (shot_speed + asteroid.velocity.length()) * dt
+            for shot in self.candidates(asteroid, margin):
+                time = asteroid.sweep(shot, dt)
+                if time is not None:
+                    impacts.append((time, asteroid, shot))
+        return earliest_hits(impacts)
+
+
+class SweepAndPrune:
+    """
+    Sprite vs sprite broad phase over sorted x intervals.
+
+    Sprites are kept ordered by the left edge of their x interval from one
+    frame to the next. Things move a few pixels per frame, so last frame's
+    order is nearly sorted and a stable sort (timsort) fixes it in close to
+    linear time. Pairs are then read off the sorted edges and pruned on y.
+    """
+
+    def __init__(self):
+        self.order = []
+
+    def update(self, sprites):
+        """
+        Re-sort for this frame's positions.
+
+        Returns the sprites in x order with their (n, 2) positions and (n,)
+        radii, which pairs() takes.
+        """
+        current = set(sprites)
+        # survivors keep last frame's place, new sprites start at the end
+        order = [sprite for sprite in self.order if sprite in current]
+        kept = set(order)
+        order.extend(sprite for sprite in sprites if sprite not in kept)
+
+        positions, radii = positions_and_radii(order)
+        resort = np.argsort(positions[:, 0] - radii, kind="stable")
+        self.order = [order[i] for i in resort.tolist()]
+        return self.order, positions[resort], radii[resort]
+
+    @staticmethod
+    def pairs(positions, radii):
+        """
+        Index pairs (i < j) whose bounding boxes overlap.
+
+        positions and radii must be in update() order. Returns two (k,)
+        index arrays, first and second.
+        """
+        left = positions[:, 0] - radii
+        right = positions[:, 0] + radii
+        # sprites after i starting before i's right edge overlap it on x
+        ends = np.searchsorted(left, right, side="right")
+        counts = ends - np.arange(len(left)) - 1
+
+        first = np.repeat(np.arange(len(left)), counts)
+        starts = np.repeat(np.cumsum(counts) - counts, counts)
+        second = first + 1 + np.arange(len(first)) - starts
+
+        reach = radii[first] + radii[second]
+        overlap_y = np.abs(positions[first, 1] - positions[second, 1]) <= reach
+        return first[overlap_y], second[overlap_y]
+
+
+def time_of_impact(offset, velocity, reach, dt):
+    """
+    Earliest time in [0, dt] at which two moving circles touch.
+
+    offset and velocity are the second circle's position and velocity
+    relative to the first at the start of the interval, reach is the sum
+    of their radii. Returns 0 when they already touch and None when they
+    don't come within reach during the interval.
+    """
+    gap = offset.length_squared() - reach * reach
+    if gap <= 0:
+        return 0.0
+    closing = offset.dot(velocity)
+    if closing >= 0:
+        return None  # moving apart or side by side
+
+    speed_sq = velocity.length_squared()
+    discriminant = closing * closing - speed_sq * gap
+    if discriminant < 0:
+        return None
+    time = (-closing - math.sqrt(discriminant)) / speed_sq
+    return time if time <= dt else None
+
+
+def earliest_hits(impacts):
+    """
+    Tie-break (time, asteroid, shot) impacts into hits.
+
+    Impacts are resolved earliest first, ties keep their input order. Each
+    asteroid splits at most once and each shot destroys at most one
+    asteroid, the later impacts of either are dropped. Returns the
+    (asteroid, shot) hits in resolution order.
+    """
+    used_asteroids = set()
+    used_shots = set()
+    found = []
+    for _, asteroid, shot in sorted(impacts, key=lambda impact: impact[0]):
+        if asteroid in used_asteroids or shot in used_shots:
+            continue
+        used_asteroids.add(asteroid)
+        used_shots.add(shot)
+        found.append((asteroid, shot))
+    return found
+
+
+def positions_and_radii(sprites):
+    """Pack sprite positions and radii into (n, 2) and (n,) float arrays"""
+    positions = np.array(
+        [(sprite.position.x, sprite.position.y) for sprite in sprites], dtype=float
+    ).reshape(-1, 2)
+    radii = np.array([sprite.radius for sprite in sprites], dtype=float)
+    return positions, radii
+
+
+def velocities(sprites):
+    """Pack sprite velocities into an (n, 2) float array"""
+    return np.array(
+        [(sprite.velocity.x, sprite.velocity.y) for sprite in sprites], dtype=float
+    ).reshape(-1, 2)
+
+
+def overlap_pairs(positions_a, radii_a, positions_b, radii_b):
+    """
+    All-pairs circle overlap test in one broadcast.
+
+    Returns an (k, 2) array of (i, j) index pairs where circle i of a
+    overlaps circle j of b, sorted by i then j. Uses squared distances and
+    the same <= rule as CircleShape.collision.
+    """
+    if not len(positions_a) or not len(positions_b):
+        return np.empty((0, 2), dtype=np.intp)
+
+    delta = positions_a[:, np.newaxis, :] - positions_b[np.newaxis, :, :]
+    distance_sq = delta[..., 0] * delta[..., 0] + delta[..., 1] * delta[..., 1]
+    reach = radii_a[:, np.newaxis] + radii_b[np.newaxis, :]
+    return np.argwhere(distance_sq <= reach * reach)
+
+
+def first_hits(pairs):
+    """
+    Tie-break overlapping (asteroid, shot) index pairs into hits.
+
+    Asteroids are resolved in index order and each takes the lowest indexed
+    shot that has not hit anything yet, so every asteroid splits at most
+    once and every shot destroys at most one asteroid per frame.
+    """
+    used = set()
+    found = []
+    last_asteroid = -1
+    for asteroid, shot in pairs.tolist():
+        if asteroid == last_asteroid or shot in used:
+            continue
+        used.add(shot)
+        found.append((asteroid, shot))
+        last_asteroid = asteroid
+    return found
+
+
+def batch_hits(asteroids, shots):
+    """Return the (asteroid, shot) hits for sprite lists using one broadcast"""
+    asteroid_positions, asteroid_radii = positions_and_radii(asteroids)
+    shot_positions, shot_radii = positions_and_radii(shots)
+    pairs = overlap_pairs(
+        asteroid_positions, asteroid_radii, shot_positions, shot_radii
+    )
+    return [(asteroids[a], shots[s]) for a, s in first_hits(pairs)]
+
+
+def sweep_pairs(
+    positions_a, velocities_a, radii_a, positions_b, velocities_b, radii_b, dt
+):
+    """
+    All-pairs swept circle test over the last dt seconds in one broadcast.
+
+    Positions are where the circles are at the end of the interval, they
+    are moved back by velocity * dt to find the start. Returns the (k, 2)
+    index pairs that touched, sorted by i then j, and their (k,) times of
+    impact from the start of the interval, see time_of_impact.
+    """
+    if not len(positions_a) or not len(positions_b):
+        return np.empty((0, 2), dtype=np.intp), np.empty(0)
+
+    # components kept apart, (n, m) arrays are cheaper than (n, m, 2) sums
+    vx = velocities_b[np.newaxis, :, 0] - velocities_a[:, np.newaxis, 0]
+    vy = velocities_b[np.newaxis, :, 1] - velocities_a[:, np.newaxis, 1]
+    dx = positions_b[np.newaxis, :, 0] - positions_a[:, np.newaxis, 0] - vx * dt
+    dy = positions_b[np.newaxis, :, 1] - positions_a[:, np.newaxis, 1] - vy * dt
+    reach = radii_a[:, np.newaxis] + radii_b[np.newaxis, :]
+
+    gap = dx * dx + dy * dy - reach * reach
+    closing = dx * vx + dy * vy
+    speed_sq = vx * vx + vy * vy
+    discriminant = closing * closing - speed_sq * gap
+    with np.errstate(divide="ignore", invalid="ignore"):
+        time = (-closing - np.sqrt(discriminant)) / speed_sq
+
+    touching = gap <= 0
+    hit = touching | ((closing < 0) & (discriminant >= 0) & (time <= dt))
+    time = np.where(touching, 0.0, time)
+    return np.argwhere(hit), time[hit]
+
+
+def batch_swept_hits(asteroids, shots, dt):
+    """Return the swept (asteroid, shot) hits for sprite lists using one broadcast"""
+    asteroid_positions, asteroid_radii = positions_and_radii(asteroids)
+    shot_positions, shot_radii = positions_and_radii(shots)
+    pairs, times = sweep_pairs(
+        asteroid_positions,
+        velocities(asteroids),
+        asteroid_radii,
+        shot_positions,
+        velocities(shots),
+        shot_radii,
+        dt,
+    )
+    impacts = [
+        (time, asteroids[a], shots[s])
+        for time, (a, s) in zip(times.tolist(), pairs.tolist())
+    ]
+    return earliest_hits(impacts)
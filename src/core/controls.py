@@ -0,0 +1,71 @@
+import pygame
+
+# keys the player reacts to, everything else is ignored
+CONTROL_KEYS = (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d)
+
+
+class InputState:
+    """
+    Keys held during one tick plus whether fire was pressed.
+
+    Indexable like pygame.key.get_pressed() so Player.move can read either.
+    """
+
+    def __init__(self, held=(), fire=False):
+        self.held = frozenset(held)
+        self.fire = fire
+
+    def __getitem__(self, key):
+        return key in self.held
+
+    def __eq__(self, other):
+        return self.held == other.held and self.fire == other.fire
+
+    def __repr__(self):
+        return f"InputState(held={sorted(self.held)}, fire={self.fire})"
+
+
+class KeyboardInput:
+    """Live keyboard, fire presses come from KEYDOWN events forwarded by main"""
+
+    def __init__(self):
+        self.fire = False
+
+    def press_fire(self):
+        self.fire = True
+
+    def poll(self):
+        keys = pygame.key.get_pressed()
+        state = InputState([key for key in CONTROL_KEYS if keys[key]], self.fire)
+        self.fire = False
+        return state
+
+
+class ScriptedInput:
+    """
+    Input replayed from a script instead of the keyboard.
+
+    script is either a sequence of InputState (looped when loop is set,
+    otherwise idle once it runs out) or a callable taking the tick number.
+    """
+
+    def __init__(self, script, loop=True):
+        self.script = script
+        self.loop = loop
+        self.tick = 0
+
+    def poll(self):
+        tick = self.tick
+        self.tick += 1
+        if callable(self.script):
+            return self.script(tick)
+        if self.loop and self.script:
+            return self.script[tick % len(self.script)]
+        if tick < len(self.script):
+            return self.script[tick]
+        return InputState()
+
+
+def spin_and_fire(tick):
+    """Bot script that turns in place and keeps the trigger held"""
+    return InputState([pygame.K_d], fire=True)
@@ -1,19 +1,28 @@
 import pygame
 from pygame import Vector2
 
+from src.core.hud import Hud
 from src.core.player import Player
+from src.core.world import ASTEROID
 from src.utils.constants import *
 
+# states of the game loop, only PLAYING advances the simulation
+PLAYING = "playing"
+PAUSED = "paused"
+GAME_OVER = "game_over"
+
 
 class GameState:
-    def __init__(self, sprite_groups):
-        self.is_game_over = False
-        self.is_paused = False
+    def __init__(self, sprite_groups, world=None):
+        self.state = PLAYING
         self.sprite_groups = sprite_groups
+        self.world = world
         self.running = True
         self.player = None
         self.speed_multiplier = 1.0
         self.last_threshold = 0
+        self.peak_entities = 0
+        self.hud = Hud()
         self.reset_game()
 
     def reset_game(self):
@@ -30,8 +39,33 @@ class GameState:
         self.sprite_groups["updatable"].add(self.player)
         self.sprite_groups["drawable"].add(self.player)
 
-        self.is_game_over = False
-        self.is_paused = False
+        self.state = PLAYING
+
+    @property
+    def is_game_over(self):
+        return self.state == GAME_OVER
+
+    @property
+    def is_paused(self):
+        return self.state == PAUSED
+
+    def pause(self):
+        if self.state == PLAYING:
+            self.state = PAUSED
+
+    def resume(self):
+        if self.state == PAUSED:
+            self.state = PLAYING
+
+    def end_game(self):
+        self.state = GAME_OVER
+
+    def entity_counts(self):
+        """Live sprite counts per group, also tracks the peak entity count"""
+        counts = {name: len(group) for name, group in self.sprite_groups.items()}
+        self.peak_entities = max(self.peak_entities, counts["drawable"])
+        counts["peak"] = self.peak_entities
+        return counts
 
     def update_difficulty(self):
         if self.player.score >= MAX_SCORE_THRESHOLD:
@@ -42,65 +76,44 @@ class GameState:
             self.speed_multiplier += SPEED_INCREASE
             self.last_threshold = current_threshold
 
+            if self.world is not None:
+                self.world.scale_velocities(ASTEROID, 1 + SPEED_INCREASE)
+                return
+
             for asteroid in self.sprite_groups["asteroid_group"]:
                 asteroid.velocity *= 1 + SPEED_INCREASE
 
     def show_game_over_popup(self, screen):
         """Show game over popup with final score and options"""
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(128)
-        screen.blit(overlay, (0, 0))
-
-        # Create popup rectangle
-        popup_width, popup_height = 400, 300
-        popup_x = SCREEN_WIDTH // 2 - popup_width // 2
-        popup_y = SCREEN_HEIGHT // 2 - popup_height // 2
-        popup_rect = pygame.Rect(popup_x, popup_y, popup_width, popup_height)
-        pygame.draw.rect(screen, (50, 50, 50), popup_rect)
-        pygame.draw.rect(screen, "white", popup_rect, 2)
-
-        # Render text
-        font = pygame.font.Font(None, 48)
-        game_over_text = font.render("Game Over", True, "white")
-        score_text = font.render(f"Final Score: {self.player.score}", True, "white")
-        continue_text = font.render("Press SPACE to continue", True, "white")
-        quit_text = font.render("Press ESC to quit", True, "white")
-
-        # Position text
-        screen.blit(
-            game_over_text,
-            game_over_text.get_rect(centerx=SCREEN_WIDTH // 2, y=popup_y + 50),
-        )
-        screen.blit(
-            score_text, score_text.get_rect(centerx=SCREEN_WIDTH // 2, y=popup_y + 120)
-        )
-        screen.blit(
-            continue_text,
-            continue_text.get_rect(centerx=SCREEN_WIDTH // 2, y=popup_y + 190),
-        )
-        screen.blit(
-            quit_text, quit_text.get_rect(centerx=SCREEN_WIDTH // 2, y=popup_y + 240)
-        )
-
+        self.hud.draw_game_over(screen, self.player.score)
         pygame.display.flip()
 
-    def handle_game_over(self, screen):
-        """Handle game over state and user input"""
-        self.is_game_over = True
-        self.show_game_over_popup(screen)
-
-        waiting = True
-        while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    return
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_SPACE:
-                        self.reset_game()
-                        return
-                    if event.key == pygame.K_ESCAPE:
-                        self.running = False
-                        return
+    def show_idle_screen(self, screen):
+        """Draw the paused or game over overlay on top of the last frame"""
+        if self.state == GAME_OVER:
+            self.show_game_over_popup(screen)
+        else:
+            self.hud.draw_paused(screen)
+            pygame.display.flip()
+
+    def handle_idle_event(self, event):
+        """
+        React to one event while paused or game over.
+
+        Returns True when the screen has to be redrawn, everything else is
+        ignored so idle screens are only drawn when something changed.
+        """
+        if event.type == pygame.QUIT:
+            self.running = False
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.running = False
+            elif event.key == pygame.K_p and self.state == PAUSED:
+                self.resume()
+            elif event.key == pygame.K_SPACE and self.state == GAME_OVER:
+                self.reset_game()
+            else:
+                return False
+        elif event.type != pygame.WINDOWEXPOSED:
+            return False
+        return True
@@ -0,0 +1,118 @@
+import pygame
+from pygame import Vector2
+
+from src.utils.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+
+POPUP_WIDTH, POPUP_HEIGHT = 400, 300
+POPUP_X = SCREEN_WIDTH // 2 - POPUP_WIDTH // 2
+POPUP_Y = SCREEN_HEIGHT // 2 - POPUP_HEIGHT // 2
+
+
+class Hud:
+    """
+    Score, lives and game over popup drawn from cached surfaces.
+
+    Fonts are loaded on first use and text is only re-rendered when its
+    string changes, so a steady frame costs a handful of blits. Nothing is
+    loaded until something is drawn, headless runs never touch pygame.font.
+    """
+
+    def __init__(self):
+        self.fonts = {}
+        self.text_cache = {}  # slot -> (text, surface)
+        self.lives_icon = None
+        self.popup = None
+        self.renders = 0  # text surfaces rendered since start
+        self.blits = 0  # blits issued since start
+
+    def font(self, size):
+        font = self.fonts.get(size)
+        if font is None:
+            font = self.fonts[size] = pygame.font.Font(None, size)
+        return font
+
+    def text(self, slot, text, size):
+        """Rendered text for a slot, re-rendered only when text changes"""
+        cached = self.text_cache.get(slot)
+        if cached is not None and cached[0] == text:
+            return cached[1]
+
+        surface = self.font(size).render(text, True, "white")
+        self.text_cache[slot] = (text, surface)
+        self.renders += 1
+        return surface
+
+    def draw_score(self, screen, score):
+        score_text = self.text("score", f"Score: {score}", 36)
+        self.blits += 1
+        return screen.blit(
+            score_text, score_text.get_rect(center=(SCREEN_WIDTH // 2, 50))
+        )
+
+    def _build_lives_icon(self):
+        icon = pygame.Surface((24, 24), pygame.SRCALPHA)
+        pos = Vector2(12, 12)
+        forward = Vector2(0, -1) * 10  # Smaller radius
+        right = Vector2(0, -1).rotate(90) * 10 / 1.5
+        points = [pos + forward, pos - forward - right, pos - forward + right]
+        pygame.draw.polygon(icon, "red", points, 2)
+        return icon
+
+    def draw_lives(self, screen, lives):
+        if self.lives_icon is None:
+            self.lives_icon = self._build_lives_icon()
+
+        screen.blits(
+            [(self.lives_icon, (18 + i * 30, 18)) for i in range(lives)],
+            doreturn=False,
+        )
+        self.blits += 1
+        # area covered by the icon row
+        return pygame.Rect(18, 18, lives * 30, self.lives_icon.get_height())
+
+    def _build_popup(self):
+        # semi-transparent overlay with the popup box and static text baked in
+        popup = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        popup.fill((0, 0, 0, 128))
+
+        popup_rect = pygame.Rect(POPUP_X, POPUP_Y, POPUP_WIDTH, POPUP_HEIGHT)
+        pygame.draw.rect(popup, (50, 50, 50), popup_rect)
+        pygame.draw.rect(popup, "white", popup_rect, 2)
+
+        font = self.font(48)
+        for text, y in (
+            ("Game Over", 50),
+            ("Press SPACE to continue", 190),
+            ("Press ESC to quit", 240),
+        ):
+            rendered = font.render(text, True, "white")
+            popup.blit(
+                rendered, rendered.get_rect(centerx=SCREEN_WIDTH // 2, y=POPUP_Y + y)
+            )
+            self.renders += 1
+        return popup
+
+    def draw_game_over(self, screen, score):
+        if self.popup is None:
+            self.popup = self._build_popup()
+
+        screen.blit(self.popup, (0, 0))
+        score_text = self.text("final_score", f"Final Score: {score}", 48)
+        screen.blit(
+            score_text, score_text.get_rect(centerx=SCREEN_WIDTH // 2, y=POPUP_Y + 120)
+        )
+        self.blits += 2
+
+    def draw_paused(self, screen):
+        paused = self.text("paused", "Paused - press P to resume", 48)
+        self.blits += 1
+        return screen.blit(
+            paused, paused.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        )
+
+    def stats(self):
+        return {
+            "renders": self.renders,
+            "blits": self.blits,
+            "cached_text": len(self.text_cache),
+        }
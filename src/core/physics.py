@@ -0,0 +1,74 @@
+import numpy as np
+import pygame
+
+from src.core.collisions import SweepAndPrune, velocities
+from src.utils.constants import RESTITUTION
+
+
+class AsteroidPhysics:
+    """
+    Bounces asteroids off each other.
+
+    Uses the impulse model of Player.handle_collision: RESTITUTION and mass
+    proportional to radius. Only pairs that are moving towards each other
+    get an impulse and are pushed apart, so freshly split asteroids that
+    start on top of each other just drift apart. Contacts come from a
+    SweepAndPrune broad phase and are all resolved in one numpy pass, an
+    asteroid touching several others gets the sum of their impulses.
+    """
+
+    def __init__(self, restitution=None):
+        self.restitution = RESTITUTION if restitution is None else restitution
+        self.broad_phase = SweepAndPrune()
+        self.candidates = 0  # bounding box pairs tested this frame
+        self.contacts = 0  # pairs that bounced this frame
+
+    def step(self, asteroids):
+        sprites, positions, radii = self.broad_phase.update(asteroids)
+        first, second = self.broad_phase.pairs(positions, radii)
+        self.candidates = len(first)
+        self.contacts = 0
+
+        delta = positions[first] - positions[second]
+        distance = np.hypot(delta[:, 0], delta[:, 1])
+        reach = radii[first] + radii[second]
+        # coincident centers have no normal, leave them to drift apart
+        touching = (distance <= reach) & (distance > 0)
+        first, second = first[touching], second[touching]
+        if not len(first):
+            return
+        # normals point from second to first, like the player's collision normal
+        normal = delta[touching] / distance[touching, np.newaxis]
+        overlap = reach[touching] - distance[touching]
+
+        involved = np.unique(np.concatenate((first, second)))
+        velocity = np.zeros_like(positions)
+        velocity[involved] = velocities([sprites[i] for i in involved.tolist()])
+        closing = ((velocity[first] - velocity[second]) * normal).sum(axis=1)
+
+        approaching = closing < 0
+        first, second = first[approaching], second[approaching]
+        normal, overlap = normal[approaching], overlap[approaching]
+        closing = closing[approaching]
+        self.contacts = len(first)
+        if not len(first):
+            return
+
+        total_mass = radii[first] + radii[second]
+        impulse = normal * (-(1 + self.restitution) * closing)[:, np.newaxis]
+        np.add.at(
+            velocity, first, impulse * (radii[second] / total_mass)[:, np.newaxis]
+        )
+        np.subtract.at(
+            velocity, second, impulse * (radii[first] / total_mass)[:, np.newaxis]
+        )
+
+        # push each pair apart by half the overlap each to prevent sticking
+        separation = normal * (overlap / 2)[:, np.newaxis]
+        np.add.at(positions, first, separation)
+        np.subtract.at(positions, second, separation)
+
+        for i in np.unique(np.concatenate((first, second))).tolist():
+            sprite = sprites[i]
+            sprite.position = pygame.Vector2(*positions[i])
+            sprite.velocity = pygame.Vector2(*velocity[i])
@@ -4,6 +4,7 @@ import pygame
 from pygame import Vector2
 
 from src.core.circleshape import CircleShape
+from src.core.controls import InputState
 from src.core.shot import Shot
 from src.utils.constants import *
 
@@ -21,6 +22,8 @@ class Player(CircleShape):
         self.timer = 0
         self.lives = 5
         self.score = 0
+        # set every tick by the simulation from its input source
+        self.controls = InputState()
 
     def rotate(self, direction: float, dt):
         """Rotate the player (direction: 1 for right, -1 for left)"""
@@ -46,7 +49,7 @@ class Player(CircleShape):
         self.screen_wrap()
 
     def move(self, dt):
-        keys = pygame.key.get_pressed()
+        keys = self.controls
 
         if keys[pygame.K_a]:
             self.rotate(-1, dt)
@@ -81,30 +84,20 @@ class Player(CircleShape):
 
     def shoot(self):
         if self.timer <= 0:
-            projectile = Shot(self.position.copy(), self.angle)
+            projectile = Shot.create(self.position.copy(), self.angle)
             self.timer = PLAYER_SHOT_COOLDOWN
 
     def hit(self):
         self.lives -= 1
         return self.lives <= 0
 
-    def draw_lives(self, screen):
-        for i in range(self.lives):
-            pos = Vector2(30 + i * 30, 30)
-
-            forward = Vector2(0, -1).rotate(0) * 10  # Smaller radius
-            right = Vector2(0, -1).rotate(90) * 10 / 1.5
-            points = [pos + forward, pos - forward - right, pos - forward + right]
-            pygame.draw.polygon(screen, "red", points, 2)
-
     def handle_collision(self, asteroid):
         collision_normal = self.position - asteroid.position
         collision_normal.normalize_ip()
 
         relative_velocity = self.velocity - asteroid.velocity
 
-        restitution = 0.8  # 1 = perfect elasticity, 0 = inelastic (stick)
-        impulse_scalar = -(1 + restitution) * relative_velocity * collision_normal
+        impulse_scalar = -(1 + RESTITUTION) * relative_velocity * collision_normal
 
         # assume mass proportional to radius
         total_mass = self.radius + asteroid.radius
@@ -131,9 +124,3 @@ class Player(CircleShape):
             self.score += 100
         else:
             self.score += 250
-
-    def draw_score(self, screen):
-        font = pygame.font.Font(None, 36)
-        score_text = font.render(f"Score: {self.score}", True, "white")
-        score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, 50))
-        screen.blit(score_text, score_rect)
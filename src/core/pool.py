@@ -0,0 +1,96 @@
+from src.utils.constants import POOL_MAX_SIZE
+
+
+class SpritePool:
+    """
+    Free lists of killed sprites waiting to be re-initialized with reset().
+
+    Sprites are filed under key(*args) so a request can prefer one that
+    was built with matching arguments (e.g. an asteroid of the same radius
+    can write its new deformed surface into the old one's buffer). If no
+    sprite matches, any free one is reset instead, and only an empty pool
+    allocates a new sprite.
+    """
+
+    def __init__(self, cls, key=None, max_size=None):
+        self.cls = cls
+        self.key = key
+        self.max_size = POOL_MAX_SIZE if max_size is None else max_size
+        self.free = {}
+        self.size = 0
+        self.allocated = 0
+        self.reused = 0
+        self.matched = 0  # reuses where the key matched
+        self.dropped = 0  # releases turned away because the pool was full
+
+    def acquire(self, *args):
+        key = self.key(*args) if self.key else None
+        bucket = self.free.get(key)
+        if bucket:
+            self.matched += 1
+        else:
+            bucket = next((free for free in self.free.values() if free), None)
+
+        if not bucket:
+            self.allocated += 1
+            return self.cls(*args)
+
+        sprite = bucket.pop()
+        self.size -= 1
+        self.reused += 1
+        if hasattr(sprite, "containers"):
+            sprite.add(sprite.containers)
+        sprite.reset(*args)
+        return sprite
+
+    def release(self, sprite):
+        if self.size >= self.max_size:
+            self.dropped += 1
+            return
+        key = self.key(*sprite.pool_key_args()) if self.key else None
+        self.free.setdefault(key, []).append(sprite)
+        self.size += 1
+
+    def clear(self):
+        self.free.clear()
+        self.size = 0
+
+    def stats(self):
+        requests = self.allocated + self.reused
+        return {
+            "size": self.size,
+            "allocated": self.allocated,
+            "reused": self.reused,
+            "matched": self.matched,
+            "dropped": self.dropped,
+            "reuse_rate": self.reused / requests if requests else 0.0,
+            "allocations_avoided": self.reused,
+        }
+
+
+class Poolable:
+    """
+    Mixin for sprites that can be recycled through a SpritePool.
+
+    Create instances with cls.create(...) instead of cls(...); once a live
+    sprite is killed it goes back to the pool for the next create().
+    """
+
+    pool = None
+
+    @classmethod
+    def create(cls, *args):
+        if cls.pool is not None:
+            return cls.pool.acquire(*args)
+        return cls(*args)
+
+    def pool_key_args(self):
+        """Arguments that would rebuild this sprite, passed to the pool key"""
+        return ()
+
+    def kill(self):
+        # only sprites that were alive go back, so double kills are harmless
+        was_alive = self.alive()
+        super().kill()
+        if was_alive and self.pool is not None:
+            self.pool.release(self)
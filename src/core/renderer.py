@@ -0,0 +1,109 @@
+import pygame
+
+from src.core.asteroid import Asteroid
+from src.core.shot import Shot
+from src.utils.constants import (
+    DIRTY_RECT_THRESHOLD,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    SHOT_RENDER_MODE,
+)
+from src.utils.profiler import profiler
+
+SCREEN_AREA = SCREEN_WIDTH * SCREEN_HEIGHT
+
+
+def draw_sprites(screen, drawable, shot_group, rects=False):
+    """
+    Draw every sprite, shots batched when SHOT_RENDER_MODE is "batched".
+
+    Returns the touched rects when rects is set, for the dirty renderer.
+    """
+    if SHOT_RENDER_MODE != "batched":
+        drawn = [sprite.draw(screen) for sprite in drawable]
+        return drawn if rects else None
+
+    drawn = [sprite.draw(screen) for sprite in drawable if sprite not in shot_group]
+    shots = Shot.draw_batch(screen, shot_group, rects)
+    return drawn + shots if rects else None
+
+
+class DirtyRectRenderer:
+    """
+    Renders a frame by clearing and pushing only the areas that changed.
+
+    Every draw call returns the rect it touched. Next frame those rects are
+    cleared, all sprites are drawn again, and only last frame's plus this
+    frame's rects are sent to pygame.display.update. Once the dirty area goes
+    above `threshold` of the screen it falls back to a full fill and flip.
+    """
+
+    def __init__(self, threshold=DIRTY_RECT_THRESHOLD):
+        self.threshold = threshold
+        self.screen_rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.previous = None  # None forces a full redraw
+        self.dirty_area = 0  # pixels pushed last frame
+        self.full_updates = 0
+        self.partial_updates = 0
+
+    def invalidate(self):
+        """Redraw the whole screen next frame, e.g. after a popup"""
+        self.previous = None
+
+    def _area(self, rects):
+        return sum(
+            rect.clip(self.screen_rect).width * rect.clip(self.screen_rect).height
+            for rect in rects
+        )
+
+    def draw(self, game_state, screen, drawable):
+        previous = self.previous
+        full = previous is None or self._area(previous) > self.threshold * SCREEN_AREA
+
+        if full:
+            screen.fill((0, 0, 0))
+        else:
+            for rect in previous:
+                screen.fill((0, 0, 0), rect)
+        Asteroid.deformed_rebuilds = 0
+
+        # Draw all game objects
+        with profiler.phase("draw_sprites"):
+            drawn = draw_sprites(
+                screen, drawable, game_state.sprite_groups["shot_group"], rects=True
+            )
+
+        # Draw UI elements
+        with profiler.phase("hud"):
+            hud = game_state.hud
+            drawn.append(hud.draw_score(screen, game_state.player.score))
+            drawn.append(hud.draw_lives(screen, game_state.player.lives))
+            overlay = profiler.draw_overlay(screen)
+            if overlay is not None:
+                drawn.append(overlay)
+        self.previous = drawn
+
+        with profiler.phase("present"):
+            self._present(previous, drawn, full)
+        profiler.count("dirty_area", self.dirty_area)
+
+    def _present(self, previous, drawn, full):
+        if not full:
+            dirty = previous + drawn
+            self.dirty_area = self._area(dirty)
+            if self.dirty_area <= self.threshold * SCREEN_AREA:
+                pygame.display.update(dirty)
+                self.partial_updates += 1
+                return
+
+        self.dirty_area = SCREEN_AREA
+        pygame.display.flip()
+        self.full_updates += 1
+
+    def stats(self):
+        return {
+            "dirty_area": self.dirty_area,
+            "dirty_fraction": self.dirty_area / SCREEN_AREA,
+            "full_updates": self.full_updates,
+            "partial_updates": self.partial_updates,
+        }
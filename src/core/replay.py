@@ -0,0 +1,109 @@
+import hashlib
+import struct
+
+import numpy as np
+
+from src.core.controls import CONTROL_KEYS, InputState, ScriptedInput
+from src.core.simulation import Simulation
+from src.utils.profiler import profiler
+
+MAGIC = b"ASTR"
+VERSION = 1
+
+# magic, version, rng seed
+HEADER = struct.Struct("<4sBQ")
+# dt, bit i set when CONTROL_KEYS[i] is held, the top bit marks fire
+TICK = struct.Struct("<dB")
+FIRE_BIT = 1 << 7
+
+
+def pack_input(controls):
+    mask = FIRE_BIT if controls.fire else 0
+    for bit, key in enumerate(CONTROL_KEYS):
+        if controls[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def unpack_input(mask):
+    held = [key for bit, key in enumerate(CONTROL_KEYS) if mask & (1 << bit)]
+    return InputState(held, bool(mask & FIRE_BIT))
+
+
+class InputLog:
+    """
+    Seed plus the dt and input of every simulated tick.
+
+    Pass one to Simulation(recorder=...), which sets the seed and fills in
+    the ticks as it steps. save() writes it as a compact binary file
+    (9 bytes per tick) and load() reads it back for replay().
+    """
+
+    def __init__(self, seed=None):
+        self.seed = seed
+        self.dts = []
+        self.masks = []
+
+    def __len__(self):
+        return len(self.dts)
+
+    def record(self, dt, controls):
+        self.dts.append(dt)
+        self.masks.append(pack_input(controls))
+
+    def inputs(self):
+        return [unpack_input(mask) for mask in self.masks]
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.seed))
+            for dt, mask in zip(self.dts, self.masks):
+                f.write(TICK.pack(dt, mask))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+
+        magic, version, seed = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} input log")
+
+        log = cls(seed)
+        for dt, mask in TICK.iter_unpack(data[HEADER.size :]):
+            log.dts.append(dt)
+            log.masks.append(mask)
+        return log
+
+
+def state_digest(simulation):
+    """Short hash of score, lives and every asteroid and shot position"""
+    game_state = simulation.game_state
+    player = game_state.player
+    sprites = [player, *simulation.sprite_groups["drawable"]]
+    state = np.array(
+        [(s.position.x, s.position.y, s.radius) for s in sprites], dtype=np.float64
+    )
+    digest = hashlib.sha1(state.tobytes())
+    digest.update(struct.pack("<qq", player.score, player.lives))
+    return digest.hexdigest()[:12]
+
+
+def replay(log, restart=True):
+    """
+    Rerun a recorded session tick for tick, returns the Simulation.
+
+    The simulation is seeded from the log and stepped with the recorded
+    dts, so it follows the same trajectory as the recording. As in
+    Simulation.run the game is reset on game over when restart is set.
+    """
+    simulation = Simulation(ScriptedInput(log.inputs(), loop=False), seed=log.seed)
+    for dt in log.dts:
+        profiler.begin_frame()
+        died = simulation.step(dt)
+        profiler.end_frame()
+        if died:
+            if not restart:
+                break
+            simulation.game_state.reset_game()
+    return simulation
@@ -4,6 +4,8 @@ import pygame
 from pygame import Vector2
 
 from src.core.circleshape import CircleShape
+from src.core.pool import Poolable
+from src.core.world import SHOT, WorldBody
 from src.utils.constants import (
     BULLET_RADIUS,
     PLAYER_SHOT_SPEED,
@@ -12,33 +14,81 @@ from src.utils.constants import (
 )
 
 
-class Shot(CircleShape):
+def outline(position, radius):
+    forward = pygame.Vector2(0, -1).rotate(0)
+    right = pygame.Vector2(0, -1).rotate(90) * radius / 1.5
+    a = position + forward * radius
+    b = position - forward * radius - right
+    c = position - forward * radius + right
+    return [a, b, c]
+
+
+class Shot(Poolable, WorldBody, CircleShape):
+    world_kind = SHOT
+
+    # pre-rendered outline blitted by draw_batch, built on first use
+    sprite = None
+    # the swept collision pass needs shots that left the screen this tick,
+    # it removes them itself when this is off
+    cull_on_update = True
+
     def __init__(self, position: Vector2, angle: float):
         super().__init__(position.x, position.y, BULLET_RADIUS)
-        self.velocity = pygame.Vector2(0, 1)
+        self.reset(position, angle)
+
+    def reset(self, position: Vector2, angle: float):
+        self.position = pygame.Vector2(position)
 
         angle_rad = math.radians(angle - 90)  # -90 to align with player direction
         self.velocity = Vector2(
             math.cos(angle_rad) * PLAYER_SHOT_SPEED,
             math.sin(angle_rad) * PLAYER_SHOT_SPEED,
         )
+        self.attach_to_world()
 
     def update(self, dt):
         self.position += self.velocity * dt
 
         # Optional: Remove shot if it goes off screen
-        if (
-            self.position.x < 0
-            or self.position.x > SCREEN_WIDTH
-            or self.position.y < 0
-            or self.position.y > SCREEN_HEIGHT
-        ):
+        if self.cull_on_update and self.off_screen():
             self.kill()
 
+    def off_screen(self):
+        position = self.position
+        return (
+            position.x < 0
+            or position.x > SCREEN_WIDTH
+            or position.y < 0
+            or position.y > SCREEN_HEIGHT
+        )
+
     def triangle(self):
-        forward = pygame.Vector2(0, -1).rotate(0)
-        right = pygame.Vector2(0, -1).rotate(90) * self.radius / 1.5
-        a = self.position + forward * self.radius
-        b = self.position - forward * self.radius - right
-        c = self.position - forward * self.radius + right
-        return [a, b, c]
+        return outline(self.position, self.radius)
+
+    @classmethod
+    def draw_batch(cls, screen, shots, rects=False):
+        """
+        Draw every shot with a single Surface.blits call.
+
+        Shots all share one shape, so it is drawn once into a small sprite
+        and blitted at each position instead of one polygon call per shot.
+        Returns the touched rects when rects is set.
+        """
+        if cls.sprite is None:
+            # room around the shape for the 2px polygon outline
+            size = 2 * BULLET_RADIUS + 4
+            cls.sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            center = Vector2(size / 2, size / 2)
+            pygame.draw.polygon(
+                cls.sprite, "white", outline(center, BULLET_RADIUS), width=2
+            )
+
+        sprite = cls.sprite
+        offset = sprite.get_width() / 2
+        return screen.blits(
+            [
+                (sprite, (shot.position.x - offset, shot.position.y - offset))
+                for shot in shots
+            ],
+            doreturn=rects,
+        )
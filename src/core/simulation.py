@@ -0,0 +1,271 @@
+import random
+
+import pygame
+
+from src.core.asteroid import Asteroid
+from src.core.asteroid_field import AsteroidField
+from src.core.collisions import BroadPhase, batch_hits, batch_swept_hits
+from src.core.controls import KeyboardInput
+from src.core.game_state import GameState
+from src.core.physics import AsteroidPhysics
+from src.core.player import Player
+from src.core.pool import SpritePool
+from src.core.shot import Shot
+from src.core.world import World
+from src.utils.constants import (
+    ASTEROID_PHYSICS,
+    COLLISION_MODE,
+    CONTINUOUS_COLLISIONS,
+    FIXED_TIMESTEP,
+    MAX_STEPS_PER_FRAME,
+    SPRITE_POOLING,
+    WORLD_BACKEND,
+)
+from src.utils.profiler import profiler
+
+
+def initialize_sprite_groups(world=None, rng=random):
+    """Initialize and return sprite groups used in the game"""
+    updatable = pygame.sprite.Group()
+    drawable = pygame.sprite.Group()
+    asteroid_group = pygame.sprite.Group()
+    shot_group = pygame.sprite.Group()
+
+    # Set up sprite containers
+    Player.containers = [updatable, drawable]
+    Shot.containers = [updatable, drawable, shot_group]
+    Asteroid.containers = [updatable, drawable, asteroid_group]
+    AsteroidField.containers = [updatable]
+
+    # the world steps shots and asteroids itself, keep them out of updatable
+    Shot.world = world
+    Asteroid.world = world
+    if world is not None:
+        Shot.containers = [drawable, shot_group]
+        Asteroid.containers = [drawable, asteroid_group]
+
+    Asteroid.rng = rng
+    Shot.cull_on_update = not CONTINUOUS_COLLISIONS
+
+    # fresh pools per session, asteroids are matched on radius
+    Shot.pool = None
+    Asteroid.pool = None
+    if SPRITE_POOLING:
+        Shot.pool = SpritePool(Shot)
+        Asteroid.pool = SpritePool(Asteroid, key=lambda x, y, radius: radius)
+
+    return updatable, drawable, asteroid_group, shot_group
+
+
+def apply_hits(game_state, asteroids, hits):
+    """
+    Resolve the player against asteroids, then the (asteroid, shot) hits.
+
+    Every collision pass finds its shot hits first, before the player
+    pushes asteroids around, and hands them here so a tick is resolved the
+    same way whichever pass found them. Returns True when the player lost
+    their last life, the shot hits are dropped in that case.
+    """
+    player = game_state.player
+    for asteroid in asteroids:
+        if player.collision(asteroid):
+            player.handle_collision(asteroid)
+            if player.hit():
+                return True
+
+    for asteroid, shot in hits:
+        player.increase_score(asteroid.radius)
+        asteroid.split()
+        shot.kill()
+
+    return False
+
+
+def resolve_collisions(game_state, broad_phase):
+    """
+    Collision pass with shots picked by the broad phase, see apply_hits.
+
+    Returns True when the player lost their last life.
+    """
+    asteroids = game_state.sprite_groups["asteroid_group"].sprites()
+    broad_phase.rebuild(game_state.sprite_groups["shot_group"])
+    return apply_hits(game_state, asteroids, broad_phase.hits(asteroids))
+
+
+def resolve_collisions_batched(game_state):
+    """Same as resolve_collisions, with the shot overlap test done as one broadcast"""
+    asteroids = game_state.sprite_groups["asteroid_group"].sprites()
+    shots = game_state.sprite_groups["shot_group"].sprites()
+    return apply_hits(game_state, asteroids, batch_hits(asteroids, shots))
+
+
+def resolve_collisions_swept(game_state, broad_phase, dt):
+    """
+    Collision pass for ticks of any length, shots are swept over the tick.
+
+    Each shot and asteroid is tested along the straight path it moved this
+    tick (see CircleShape.sweep), and hits are resolved earliest impact
+    first with the usual one split per asteroid and one per shot. The
+    player test stays an overlap test (see apply_hits). Returns True when
+    the player lost their last life.
+
+    Shots that left the screen during the tick are still swept (the update
+    phase keeps them, see Shot.cull_on_update), the ones that hit nothing
+    are removed here.
+    """
+    asteroids = game_state.sprite_groups["asteroid_group"].sprites()
+    shots = game_state.sprite_groups["shot_group"].sprites()
+
+    if COLLISION_MODE == "kernel":
+        hits = batch_swept_hits(asteroids, shots, dt)
+    else:
+        broad_phase.rebuild(shots)
+        hits = broad_phase.swept_hits(asteroids, dt)
+
+    hit_shots = {shot for _, shot in hits}
+    for shot in shots:
+        if shot not in hit_shots and shot.off_screen():
+            shot.kill()
+
+    return apply_hits(game_state, asteroids, hits)
+
+
+class Simulation:
+    """
+    Game simulation without any rendering or window.
+
+    Owns the sprite groups, game state and asteroid field and advances them
+    from an injectable input source (see src.core.controls). advance() runs
+    fixed FIXED_TIMESTEP steps from an accumulator, step() runs one step of
+    any length. Rendering is left to whoever drives it.
+
+    All randomness comes from one random.Random seeded with seed (a fresh
+    seed is picked when None). A recorder such as replay.InputLog is given
+    the seed and then the dt and input of every step, so a run can be
+    replayed exactly.
+    """
+
+    def __init__(self, input_source=None, timestep=None, seed=None, recorder=None):
+        if seed is None:
+            seed = random.getrandbits(63)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.recorder = recorder
+        if recorder is not None:
+            recorder.seed = seed
+
+        self.world = World() if WORLD_BACKEND else None
+        updatable, drawable, asteroid_group, shot_group = initialize_sprite_groups(
+            self.world, self.rng
+        )
+        self.sprite_groups = {
+            "updatable": updatable,
+            "drawable": drawable,
+            "asteroid_group": asteroid_group,
+            "shot_group": shot_group,
+        }
+        self.game_state = GameState(self.sprite_groups, self.world)
+
+        # need to instantiate so that objects
+        # are added to containers
+        self.asteroid_field = AsteroidField(asteroid_group, rng=self.rng)
+        self.broad_phase = BroadPhase()
+        self.physics = AsteroidPhysics() if ASTEROID_PHYSICS else None
+
+        self.input = input_source if input_source is not None else KeyboardInput()
+        self.timestep = FIXED_TIMESTEP if timestep is None else timestep
+        self.accumulator = 0.0
+        self.ticks = 0
+        self.time = 0.0
+
+    def step(self, dt):
+        """Advance one tick of dt seconds, returns True if the player died"""
+        game_state = self.game_state
+        controls = self.input.poll()
+        if self.recorder is not None:
+            self.recorder.record(dt, controls)
+        game_state.player.controls = controls
+        if controls.fire:
+            game_state.player.shoot()
+
+        with profiler.phase("update"):
+            # step the world first so asteroids spawned this tick
+            # start moving next tick, same as with updatable
+            if self.world is not None:
+                self.world.step(dt, cull_shots=not CONTINUOUS_COLLISIONS)
+            self.sprite_groups["updatable"].update(dt)
+            # only once all asteroids moved, on the per sprite path the
+            # field updates before the asteroids spawned after it
+            self.asteroid_field.enforce_lifetime()
+
+        with profiler.phase("collisions"):
+            if CONTINUOUS_COLLISIONS:
+                died = resolve_collisions_swept(game_state, self.broad_phase, dt)
+            elif COLLISION_MODE == "kernel":
+                died = resolve_collisions_batched(game_state)
+            else:
+                died = resolve_collisions(game_state, self.broad_phase)
+            if COLLISION_MODE == "kernel":
+                checks = len(self.sprite_groups["asteroid_group"]) * (
+                    len(self.sprite_groups["shot_group"]) + 1
+                )
+            else:
+                checks = self.broad_phase.checks
+
+        # bounces and speed ups change velocities, so they wait until the
+        # collision pass is done: the swept pass takes each asteroid to have
+        # moved position - velocity * dt -> position during this tick
+        if self.physics is not None:
+            with profiler.phase("physics"):
+                self.physics.step(self.sprite_groups["asteroid_group"].sprites())
+            profiler.count("asteroid_contacts", self.physics.contacts)
+
+        with profiler.phase("difficulty"):
+            game_state.update_difficulty()
+
+        counts = game_state.entity_counts()
+        profiler.count("entities", counts["drawable"])
+        profiler.count("collision_checks", checks)
+        self.ticks += 1
+        self.time += dt
+        return died
+
+    def advance(self, elapsed):
+        """
+        Run as many fixed steps as elapsed seconds allow.
+
+        Leftover time stays in the accumulator for the next call, and at
+        most MAX_STEPS_PER_FRAME steps run so a long stall can't snowball.
+        Returns True if the player died, stopping at that step.
+        """
+        self.accumulator += elapsed
+        steps = 0
+        while self.accumulator >= self.timestep:
+            if steps == MAX_STEPS_PER_FRAME:
+                self.accumulator = 0.0
+                break
+            self.accumulator -= self.timestep
+            steps += 1
+            if self.step(self.timestep):
+                return True
+        return False
+
+    def run(self, seconds, restart=True):
+        """
+        Run seconds of simulated time as fast as possible.
+
+        When the player dies the game is reset if restart is set, otherwise
+        the run stops. Returns the number of game overs.
+        """
+        game_overs = 0
+        for _ in range(round(seconds / self.timestep)):
+            # headless runs profile every tick as one frame
+            profiler.begin_frame()
+            died = self.step(self.timestep)
+            profiler.end_frame()
+            if died:
+                game_overs += 1
+                if not restart:
+                    break
+                self.game_state.reset_game()
+        return game_overs
@@ -0,0 +1,56 @@
+import threading
+import time
+
+from src.core.asteroid import Asteroid
+from src.utils.constants import STARTUP_ASYNC_ASTEROIDS, TEXTURE_BANK
+from src.utils.texture_bank import texture_bank
+from src.utils.utils import load_noise
+
+
+class Startup:
+    """
+    Startup milestones and the first wave of asteroid textures.
+
+    begin() loads opensimplex and opens the texture bank on a background
+    thread while the window comes up, and builds the first_wave asteroid
+    surfaces on the texture builder so the first frames never wait on
+    noise. Milestones are seconds since the process started, see report().
+    """
+
+    def __init__(self, started, first_wave=STARTUP_ASYNC_ASTEROIDS):
+        self.started = started
+        self.first_wave = first_wave
+        self.marks = {}
+        self.surfaces_built = 0
+
+    def mark(self, name):
+        self.marks.setdefault(name, time.perf_counter() - self.started)
+
+    def begin(self):
+        threading.Thread(target=self._warm_up, name="warm-up", daemon=True).start()
+        Asteroid.async_first_wave = self.first_wave
+
+    def _warm_up(self):
+        load_noise()
+        if TEXTURE_BANK:
+            texture_bank.ensure_open()
+        self.mark("warm_up_done")
+
+    def frame_drawn(self):
+        """Call after each rendered frame, tracks surfaces built so far"""
+        self.mark("first_frame")
+        self.surfaces_built += Asteroid.deformed_rebuilds
+        if not self.surfaces_built:
+            return
+        self.mark("first_textured_asteroid")
+
+    @property
+    def textured(self):
+        return "first_textured_asteroid" in self.marks
+
+    def report(self):
+        lines = ["Startup (seconds since process start):"]
+        for name, seconds in sorted(self.marks.items(), key=lambda mark: mark[1]):
+            lines.append(f"  {name:<24} {seconds:.3f}")
+        lines.append(f"  texture bank: {texture_bank.stats()['status']}")
+        return "\n".join(lines)
@@ -0,0 +1,195 @@
+import numpy as np
+import pygame
+
+from src.utils.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+
+# entity kinds stored per slot, 0 marks a free slot
+FREE = 0
+ASTEROID = 1
+SHOT = 2
+
+
+class WorldVector:
+    """
+    Vector2 attribute that lives in a World array while the sprite is attached.
+
+    Only defines __get__, so a detached sprite's own instance dict entry
+    wins and reads cost nothing extra; attached sprites have theirs moved
+    into the arrays (see World.attach) and fall through to here. Writes go
+    through the hook installed by WorldBody.route_writes. Reads hand back a fresh Vector2, so in
+    place edits must be assigned back (`sprite.position += v` works,
+    `sprite.position.x = 1` does not).
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if obj.world_slot is None:
+            raise AttributeError(self.name)
+        row = getattr(obj.world, self.name)[obj.world_slot]
+        return pygame.Vector2(row[0], row[1])
+
+
+class WorldScalar(WorldVector):
+    """Float attribute that lives in a World array while the sprite is attached"""
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if obj.world_slot is None:
+            raise AttributeError(self.name)
+        return float(getattr(obj.world, self.name)[obj.world_slot])
+
+
+# attributes moved into World arrays while a sprite is attached
+WORLD_ATTRIBUTES = frozenset(("position", "velocity", "rotation", "rotation_speed"))
+
+
+def _world_setattr(sprite, name, value):
+    if name in WORLD_ATTRIBUTES and sprite.world_slot is not None:
+        getattr(sprite.world, name)[sprite.world_slot] = value
+    else:
+        object.__setattr__(sprite, name, value)
+
+
+class WorldBody:
+    """
+    Mixin for sprites whose kinematics can be stored in a World.
+
+    Subclasses set world_kind and call attach_to_world() once their
+    attributes are initialized. With no world set everything stays a
+    normal attribute and update() runs per sprite as before.
+    """
+
+    world = None
+    world_kind = FREE
+    world_slot = None
+
+    position = WorldVector()
+    velocity = WorldVector()
+    rotation = WorldScalar()
+    rotation_speed = WorldScalar()
+
+    @staticmethod
+    def route_writes():
+        """
+        Send writes of WORLD_ATTRIBUTES on attached sprites to their World.
+
+        Installed by the first World instead of being defined here, a
+        Python __setattr__ slows every write on every sprite, so processes
+        that never create a World keep plain attribute writes.
+        """
+        WorldBody.__setattr__ = _world_setattr
+
+    def attach_to_world(self):
+        if self.world is not None and self.world_slot is None:
+            self.world.attach(self)
+
+    def kill(self):
+        if self.world_slot is not None:
+            self.world.detach(self)
+        super().kill()
+
+
+class World:
+    """
+    Structure of arrays store for asteroid and shot kinematics.
+
+    Every attached sprite owns one slot in contiguous numpy arrays, free
+    slots are recycled through a free list. step() integrates all of them
+    at once instead of calling update() on each sprite.
+    """
+
+    def __init__(self, capacity=256):
+        WorldBody.route_writes()
+        self.capacity = 0
+        self.position = np.zeros((0, 2))
+        self.velocity = np.zeros((0, 2))
+        self.radius = np.zeros(0)
+        self.rotation = np.zeros(0)
+        self.rotation_speed = np.zeros(0)
+        self.kind = np.zeros(0, dtype=np.int8)
+        self.sprites = []
+        self.free_slots = []
+        self._grow(capacity)
+
+    def _grow(self, capacity):
+        extra = capacity - self.capacity
+        self.position = np.concatenate([self.position, np.zeros((extra, 2))])
+        self.velocity = np.concatenate([self.velocity, np.zeros((extra, 2))])
+        self.radius = np.concatenate([self.radius, np.zeros(extra)])
+        self.rotation = np.concatenate([self.rotation, np.zeros(extra)])
+        self.rotation_speed = np.concatenate([self.rotation_speed, np.zeros(extra)])
+        self.kind = np.concatenate([self.kind, np.zeros(extra, dtype=np.int8)])
+        self.sprites.extend([None] * extra)
+        # pop() hands out the lowest slots first
+        self.free_slots.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+
+    def attach(self, sprite):
+        if not self.free_slots:
+            self._grow(self.capacity * 2)
+        slot = self.free_slots.pop()
+
+        # move the current attribute values into the arrays
+        state = sprite.__dict__
+        self.position[slot] = state.pop("position")
+        self.velocity[slot] = state.pop("velocity", (0, 0))
+        self.rotation[slot] = state.pop("rotation", 0.0)
+        self.rotation_speed[slot] = state.pop("rotation_speed", 0.0)
+        self.radius[slot] = sprite.radius
+        self.kind[slot] = sprite.world_kind
+        self.sprites[slot] = sprite
+        sprite.world_slot = slot
+
+    def detach(self, sprite):
+        slot = sprite.world_slot
+        if slot is None:
+            return
+
+        # hand the values back so the sprite keeps working after kill()
+        sprite.world_slot = None
+        sprite.position = pygame.Vector2(*self.position[slot])
+        sprite.velocity = pygame.Vector2(*self.velocity[slot])
+        sprite.rotation = float(self.rotation[slot])
+        sprite.rotation_speed = float(self.rotation_speed[slot])
+
+        self.kind[slot] = FREE
+        self.velocity[slot] = 0
+        self.rotation_speed[slot] = 0
+        self.sprites[slot] = None
+        self.free_slots.append(slot)
+
+    def count(self, kind=None):
+        if kind is None:
+            return self.capacity - len(self.free_slots)
+        return int(np.count_nonzero(self.kind == kind))
+
+    def step(self, dt, cull_shots=True):
+        """
+        Advance every attached sprite, same rules as Asteroid/Shot.update.
+
+        Shots that went off screen are removed unless cull_shots is off
+        (see Shot.cull_on_update).
+        """
+        # free slots have zero velocity so they can be integrated blindly
+        self.position += self.velocity * dt
+        self.rotation += self.rotation_speed * dt
+        self.rotation %= 360
+        if not cull_shots:
+            return
+
+        # Remove shots that went off screen
+        x = self.position[:, 0]
+        y = self.position[:, 1]
+        off_screen = (self.kind == SHOT) & (
+            (x < 0) | (x > SCREEN_WIDTH) | (y < 0) | (y > SCREEN_HEIGHT)
+        )
+        for slot in np.flatnonzero(off_screen):
+            self.sprites[slot].kill()
+
+    def scale_velocities(self, kind, factor):
+        self.velocity[self.kind == kind] *= factor
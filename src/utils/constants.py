@@ -5,6 +5,14 @@ ASTEROID_MIN_RADIUS = 10
 ASTEROID_KINDS = 3
 ASTEROID_SPAWN_RATE = 0.8  # seconds
 ASTEROID_MAX_RADIUS = ASTEROID_MIN_RADIUS * ASTEROID_KINDS
+ASTEROID_TEXTURE_SEEDS = 1000  # textures are seeded from 1..N
+
+# what happens to asteroids that drift past the margin around the screen:
+# "wrap" to the other side, "despawn", or "cap" (leave them be).
+# Whatever the policy, the oldest asteroids are evicted above ASTEROID_CAP
+ASTEROID_LIFETIME_POLICY = "wrap"
+ASTEROID_LIFETIME_MARGIN = ASTEROID_MAX_RADIUS
+ASTEROID_CAP = 200
 
 PLAYER_RADIUS = 20
 PLAYER_TURNED_SPEED = 300
@@ -17,3 +25,62 @@ PLAYER_SHOT_COOLDOWN = 0.3
 SCORE_THRESHOLD = 1000
 SPEED_INCREASE = 0.2
 MAX_SCORE_THRESHOLD = 5000
+
+TEXTURE_CACHE_BUDGET = 32 * 1024 * 1024  # bytes
+TEXTURE_CACHE_PREWARM = False  # build every texture at startup
+# textures prebuilt by `main.py --build-texture-bank`, path relative to the
+# repo root. Missing or stale banks fall back to generating textures
+TEXTURE_BANK = True
+TEXTURE_BANK_PATH = "asteroid_textures.bank"
+
+# "exact" rotates every frame, "atlas" uses pre-rotated angle buckets
+ROTATION_MODE = "exact"
+ROTATION_ATLAS_BUCKETS = 64
+ROTATION_ATLAS_BUDGET = 64 * 1024 * 1024  # bytes
+
+# "brute" tests every shot against every asteroid, "grid" uses a spatial hash,
+# "kernel" tests all pairs in one numpy broadcast
+COLLISION_MODE = "grid"
+# sweep shots against asteroids over each tick instead of only testing
+# where they ended up, so long ticks can't let shots pass through
+CONTINUOUS_COLLISIONS = False
+# bounce asteroids off each other, pairs come from a sweep and prune pass
+ASTEROID_PHYSICS = False
+# bounciness of player and asteroid collisions, 1 = perfect elasticity,
+# 0 = inelastic (stick). Mass is taken as proportional to radius
+RESTITUTION = 0.8
+
+# keep asteroid and shot kinematics in numpy arrays stepped in one go
+WORLD_BACKEND = False
+
+# recycle killed shots and asteroids instead of allocating new ones
+SPRITE_POOLING = True
+POOL_MAX_SIZE = 512  # free sprites kept per pool
+
+FIXED_TIMESTEP = 1 / 60  # seconds per simulation step
+MAX_STEPS_PER_FRAME = 8  # drop time beyond this instead of spiraling
+
+# "full" clears and flips the whole screen, "dirty" only touched rects
+RENDER_MODE = "full"
+DIRTY_RECT_THRESHOLD = 0.5  # fraction of the screen before falling back to flip
+# "polygon" draws each shot on its own, "batched" blits them all in one call
+SHOT_RENDER_MODE = "polygon"
+
+PROFILER_ENABLED = False  # also turned on by main.py --profile
+PROFILER_WINDOW = 300  # frames kept for rolling percentiles
+
+# build asteroid textures and deformed surfaces on worker threads,
+# asteroids draw their outline until theirs is ready
+ASYNC_TEXTURES = False
+TEXTURE_BUILDER_WORKERS = 2
+TEXTURE_BUILDER_QUEUE = 32  # builds in flight before new requests wait a frame
+
+# asteroids whose surfaces are built in the background right after startup,
+# even with ASYNC_TEXTURES off, so the first frames never block on noise
+STARTUP_ASYNC_ASTEROIDS = 8
+
+# lower asteroid detail when frames run over budget, see quality_governor
+QUALITY_FRAME_BUDGET = 1 / 60  # seconds of work per frame, sleeping excluded
+QUALITY_WINDOW = 30  # frames averaged before each decision
+QUALITY_RAISE_BELOW = 0.6  # step detail back up under this share of the budget
+QUALITY_LEVEL = None  # pin a detail level (0 = full) instead of adapting
@@ -0,0 +1,124 @@
+import numpy as np
+from opensimplex import OpenSimplex
+from opensimplex.constants import (
+    GRADIENTS2,
+    NORM_CONSTANT2,
+    SQUISH_CONSTANT2,
+    STRETCH_CONSTANT2,
+)
+
+
+def _extrapolate2(perm, xsb, ysb, dx, dy):
+    index = perm[(perm[xsb & 0xFF] + ysb) & 0xFF] & 0x0E
+    return GRADIENTS2[index] * dx + GRADIENTS2[index + 1] * dy
+
+
+def _contribution(perm, xsb, ysb, dx, dy):
+    attn = 2 - dx * dx - dy * dy
+    attn = np.where(attn > 0, attn, 0.0)
+    attn *= attn
+    return attn * attn * _extrapolate2(perm, xsb, ysb, dx, dy)
+
+
+def noise2_array(noise_gen: OpenSimplex, x, y):
+    """
+    Vectorized version of OpenSimplex.noise2 evaluated element-wise.
+
+    Unlike noise_gen.noise2array (which is a plain python loop when
+    numba is not installed), every step runs as a numpy array op.
+    The arithmetic follows opensimplex's _noise2 operation for operation,
+    so results are bit-identical to calling noise2 per point.
+
+    x, y: float arrays of the same shape
+    """
+    perm = noise_gen._perm
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # Place input coordinates onto grid.
+    stretch_offset = (x + y) * STRETCH_CONSTANT2
+    xs = x + stretch_offset
+    ys = y + stretch_offset
+
+    # Floor to get grid coordinates of rhombus super-cell origin.
+    xsb = np.floor(xs).astype(np.int64)
+    ysb = np.floor(ys).astype(np.int64)
+
+    # Skew out to get actual coordinates of rhombus origin.
+    squish_offset = (xsb + ysb) * SQUISH_CONSTANT2
+    xb = xsb + squish_offset
+    yb = ysb + squish_offset
+
+    # Compute grid coordinates relative to rhombus origin.
+    xins = xs - xsb
+    yins = ys - ysb
+    in_sum = xins + yins
+
+    # Positions relative to origin point.
+    dx0 = x - xb
+    dy0 = y - yb
+
+    # Contribution (1,0)
+    dx1 = dx0 - 1 - SQUISH_CONSTANT2
+    dy1 = dy0 - 0 - SQUISH_CONSTANT2
+    value = _contribution(perm, xsb + 1, ysb + 0, dx1, dy1)
+
+    # Contribution (0,1)
+    dx2 = dx0 - 0 - SQUISH_CONSTANT2
+    dy2 = dy0 - 1 - SQUISH_CONSTANT2
+    value = value + _contribution(perm, xsb + 0, ysb + 1, dx2, dy2)
+
+    # Pick the extra vertex for each point, mirroring the scalar branches
+    lower = in_sum <= 1
+    x_gt_y = xins > yins
+
+    zins = np.where(lower, 1 - in_sum, 2 - in_sum)
+    lower_near_origin = lower & ((zins > xins) | (zins > yins))
+    upper_near_origin = ~lower & ((zins < xins) | (zins < yins))
+
+    two_squish = 2 * SQUISH_CONSTANT2
+    conditions = [
+        lower_near_origin & x_gt_y,
+        lower_near_origin & ~x_gt_y,
+        lower & ~lower_near_origin,
+        upper_near_origin & x_gt_y,
+        upper_near_origin & ~x_gt_y,
+    ]
+    xsv_ext = np.select(conditions, [xsb + 1, xsb - 1, xsb + 1, xsb + 2, xsb], xsb)
+    ysv_ext = np.select(conditions, [ysb - 1, ysb + 1, ysb + 1, ysb, ysb + 2], ysb)
+    dx_ext = np.select(
+        conditions,
+        [
+            dx0 - 1,
+            dx0 + 1,
+            dx0 - 1 - two_squish,
+            dx0 - 2 - two_squish,
+            dx0 + 0 - two_squish,
+        ],
+        dx0,
+    )
+    dy_ext = np.select(
+        conditions,
+        [
+            dy0 + 1,
+            dy0 - 1,
+            dy0 - 1 - two_squish,
+            dy0 + 0 - two_squish,
+            dy0 - 2 - two_squish,
+        ],
+        dy0,
+    )
+
+    # Inside the (1,1) triangle the base vertex moves to (1,1)
+    xsb = np.where(lower, xsb, xsb + 1)
+    ysb = np.where(lower, ysb, ysb + 1)
+    dx0 = np.where(lower, dx0, dx0 - 1 - two_squish)
+    dy0 = np.where(lower, dy0, dy0 - 1 - two_squish)
+
+    # Contribution (0,0) or (1,1)
+    value = value + _contribution(perm, xsb, ysb, dx0, dy0)
+
+    # Extra Vertex
+    value = value + _contribution(perm, xsv_ext, ysv_ext, dx_ext, dy_ext)
+
+    return value / NORM_CONSTANT2
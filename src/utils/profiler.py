@@ -0,0 +1,154 @@
+import csv
+import json
+import time
+from collections import deque
+
+import numpy as np
+import pygame
+
+from src.utils.constants import PROFILER_ENABLED, PROFILER_WINDOW
+
+
+class _Phase:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        current = self.profiler.current
+        current[self.name] = current.get(self.name, 0.0) + elapsed
+
+
+class _NoPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NO_PHASE = _NoPhase()
+
+
+class FrameProfiler:
+    """
+    Named phase timers and counters collected per frame.
+
+    Wrap each stage of the loop in `with profiler.phase("name"):` and report
+    counters with profiler.count(). end_frame() files the frame away, keeps
+    a rolling window of frame times for percentiles and a full record list
+    for export(). While disabled phase() hands back a shared no-op context
+    and count() returns straight away.
+    """
+
+    def __init__(self, enabled=PROFILER_ENABLED, window=PROFILER_WINDOW):
+        self.enabled = enabled
+        self.show_overlay = enabled
+        self.frame_times = deque(maxlen=window)
+        self.records = []
+        self.current = {}
+        self.frame_start = 0.0
+        self.overlay = None
+        self.overlay_font = None
+
+    def phase(self, name):
+        if not self.enabled:
+            return _NO_PHASE
+        return _Phase(self, name)
+
+    def count(self, name, value):
+        if self.enabled:
+            self.current[name] = value
+
+    def begin_frame(self):
+        if self.enabled:
+            self.current = {}
+            self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        total = time.perf_counter() - self.frame_start
+        self.frame_times.append(total)
+        record = {"frame": len(self.records), "total": total}
+        record.update(self.current)
+        self.records.append(record)
+
+    def percentiles(self):
+        """Rolling p50/p95/p99 frame time in milliseconds"""
+        if not self.frame_times:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+        p50, p95, p99 = np.percentile(np.array(self.frame_times) * 1000, [50, 95, 99])
+        return {"p50": float(p50), "p95": float(p95), "p99": float(p99)}
+
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+
+    def draw_overlay(self, screen):
+        """Draw the stats box in the top right corner, returns its rect"""
+        if not (self.enabled and self.show_overlay and self.records):
+            return None
+
+        # re-render twice a second, blit the cached surface in between
+        if self.overlay is None or len(self.records) % 30 == 0:
+            if self.overlay_font is None:
+                self.overlay_font = pygame.font.Font(None, 20)
+            self.overlay = self._render_overlay()
+
+        rect = self.overlay.get_rect(topright=(screen.get_width() - 10, 10))
+        return screen.blit(self.overlay, rect)
+
+    def _render_overlay(self):
+        stats = self.percentiles()
+        last = self.records[-1]
+        lines = [
+            f"frame p50 {stats['p50']:.2f}  p95 {stats['p95']:.2f}  "
+            f"p99 {stats['p99']:.2f} ms"
+        ]
+        for name, value in last.items():
+            if name in ("frame", "total"):
+                continue
+            if isinstance(value, float):
+                lines.append(f"{name}: {value * 1000:.2f} ms")
+            else:
+                lines.append(f"{name}: {value}")
+
+        rendered = [self.overlay_font.render(line, True, "yellow") for line in lines]
+        width = max(line.get_width() for line in rendered) + 12
+        height = sum(line.get_height() for line in rendered) + 12
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 160))
+        y = 6
+        for line in rendered:
+            overlay.blit(line, (6, y))
+            y += line.get_height()
+        return overlay
+
+    def export(self, path):
+        """Write per-frame records to .json or .csv, depending on the path"""
+        if path.endswith(".json"):
+            with open(path, "w") as f:
+                json.dump(
+                    {"percentiles_ms": self.percentiles(), "frames": self.records}, f
+                )
+            return
+
+        columns = []
+        for record in self.records:
+            columns.extend(name for name in record if name not in columns)
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(self.records)
+
+
+# process-wide profiler, main turns it on with --profile
+profiler = FrameProfiler()
@@ -0,0 +1,115 @@
+from collections import deque
+
+from src.utils.constants import (
+    ASTEROID_MAX_RADIUS,
+    QUALITY_FRAME_BUDGET,
+    QUALITY_LEVEL,
+    QUALITY_RAISE_BELOW,
+    QUALITY_WINDOW,
+)
+
+# detail levels from full (0) to cheapest. Textures and warps are built
+# once per asteroid, so those only change for asteroids built afterwards
+LEVELS = (
+    {
+        "outline_points": 32,  # polygon points of Asteroid.triangle
+        "atlas_rotation": False,  # nearest rotation bucket instead of rotating
+        "texture_scale": 1.0,  # noise resolution of new textures
+        "warp_scale": 1.0,  # deform resolution of the largest asteroids
+        "small_warp_scale": 1.0,  # and of every smaller one
+    },
+    {
+        "outline_points": 24,
+        "atlas_rotation": True,
+        "texture_scale": 1.0,
+        "warp_scale": 1.0,
+        "small_warp_scale": 1.0,
+    },
+    {
+        "outline_points": 16,
+        "atlas_rotation": True,
+        "texture_scale": 0.5,
+        "warp_scale": 1.0,
+        "small_warp_scale": 0.5,
+    },
+    {
+        "outline_points": 12,
+        "atlas_rotation": True,
+        "texture_scale": 0.5,
+        "warp_scale": 0.5,
+        "small_warp_scale": 0.5,
+    },
+)
+
+
+class QualityGovernor:
+    """
+    Picks a detail level from LEVELS that keeps frames within budget.
+
+    frame() is fed the work time of every frame. Once window frames are in,
+    detail drops a level if their mean is over budget and comes back up a
+    level if it is under raise_below of the budget. The gap between the two
+    and refilling the window after every change keep it from flip-flopping.
+    A pinned level (see QUALITY_LEVEL) is never changed.
+    """
+
+    def __init__(
+        self,
+        budget=QUALITY_FRAME_BUDGET,
+        window=QUALITY_WINDOW,
+        raise_below=QUALITY_RAISE_BELOW,
+        pinned=QUALITY_LEVEL,
+    ):
+        self.budget = budget
+        self.raise_below = raise_below
+        self.frame_times = deque(maxlen=window)
+        self.frames = 0
+        self.decisions = []  # (frame, old level, new level, mean frame ms)
+        self.pin(pinned)
+
+    def pin(self, level):
+        """Hold level (an index into LEVELS), None goes back to adapting"""
+        self.pinned = level
+        self.index = 0 if level is None else level
+        self.level = LEVELS[self.index]
+        self.frame_times.clear()
+
+    def frame(self, seconds):
+        self.frames += 1
+        if self.pinned is not None:
+            return
+        self.frame_times.append(seconds)
+        if len(self.frame_times) < self.frame_times.maxlen:
+            return
+
+        mean = sum(self.frame_times) / len(self.frame_times)
+        if mean > self.budget and self.index < len(LEVELS) - 1:
+            self._change(self.index + 1, mean)
+        elif mean < self.budget * self.raise_below and self.index > 0:
+            self._change(self.index - 1, mean)
+
+    def _change(self, index, mean):
+        self.decisions.append((self.frames, self.index, index, mean * 1000))
+        self.index = index
+        self.level = LEVELS[index]
+        # judge the new level on its own frames only
+        self.frame_times.clear()
+
+    def warp_scale(self, radius):
+        if radius >= ASTEROID_MAX_RADIUS:
+            return self.level["warp_scale"]
+        return self.level["small_warp_scale"]
+
+    def stats(self):
+        return {
+            "level": self.index,
+            "pinned": self.pinned is not None,
+            "frames": self.frames,
+            "steps_down": sum(new > old for _, old, new, _ in self.decisions),
+            "steps_up": sum(new < old for _, old, new, _ in self.decisions),
+            "decisions": self.decisions[-10:],
+        }
+
+
+# process-wide governor, fed by main's frame loop
+quality_governor = QualityGovernor()
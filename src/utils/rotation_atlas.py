@@ -0,0 +1,91 @@
+from collections import OrderedDict
+
+import pygame
+
+from src.utils.constants import ROTATION_ATLAS_BUCKETS, ROTATION_ATLAS_BUDGET
+
+
+class RotationAtlas:
+    """
+    Shared store of pre-rotated frames for sprite surfaces.
+
+    Each source surface gets `buckets` evenly spaced angles, rendered lazily
+    the first time that angle is asked for. Sources are evicted least
+    recently used first once all their frames go over the byte budget.
+    """
+
+    def __init__(self, buckets=ROTATION_ATLAS_BUCKETS, budget=ROTATION_ATLAS_BUDGET):
+        self.buckets = buckets
+        self.budget = budget  # bytes
+        # id(source) -> [source, frames, nbytes], holding the source keeps
+        # its id from being reused while the entry is alive
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def bucket(self, angle):
+        return round(angle * self.buckets / 360) % self.buckets
+
+    def get(self, source, angle):
+        """Return the pre-rotated frame nearest to angle (degrees)"""
+        key = id(source)
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = [source, [None] * self.buckets, 0]
+            self.entries[key] = entry
+        else:
+            self.entries.move_to_end(key)
+
+        index = self.bucket(angle)
+        frame = entry[1][index]
+        if frame is not None:
+            self.hits += 1
+            return frame
+
+        self.misses += 1
+        frame = pygame.transform.rotate(source, index * 360 / self.buckets)
+        entry[1][index] = frame
+
+        nbytes = frame.get_width() * frame.get_height() * frame.get_bytesize()
+        entry[2] += nbytes
+        self.size += nbytes
+        self._evict(keep=key)
+        return frame
+
+    def _evict(self, keep):
+        while self.size > self.budget and len(self.entries) > 1:
+            key = next(iter(self.entries))
+            if key == keep:
+                break
+            _, _, nbytes = self.entries.pop(key)
+            self.size -= nbytes
+            self.evictions += 1
+
+    def discard(self, source):
+        """Drop the frames of source, for when its pixels are rewritten"""
+        entry = self.entries.pop(id(source), None)
+        if entry is not None:
+            self.size -= entry[2]
+
+    def clear(self):
+        self.entries.clear()
+        self.size = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "sources": len(self.entries),
+            "bytes": self.size,
+            "budget": self.budget,
+            "buckets": self.buckets,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# process-wide atlas shared by all asteroids
+rotation_atlas = RotationAtlas()
@@ -0,0 +1,169 @@
+import hashlib
+import importlib.metadata
+import inspect
+import mmap
+import os
+import struct
+import threading
+
+import numpy as np
+import pygame
+
+from src.utils import utils
+from src.utils.constants import (
+    ASTEROID_KINDS,
+    ASTEROID_MIN_RADIUS,
+    ASTEROID_TEXTURE_SEEDS,
+    TEXTURE_BANK_PATH,
+)
+
+MAGIC = b"ATXB"
+VERSION = 1
+
+# magic, version, generator fingerprint, entry count
+HEADER = struct.Struct("<4sH20sI")
+# radius, seed, byte offset of the texture's RGBA rows
+ENTRY = struct.Struct("<HIQ")
+
+# repo root, TEXTURE_BANK_PATH is relative to it
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def bank_radii():
+    return [ASTEROID_MIN_RADIUS * kind for kind in range(1, ASTEROID_KINDS + 1)]
+
+
+def generator_fingerprint():
+    """
+    Hash of everything a texture depends on besides radius and seed.
+
+    Covers the noise and texture source code, the opensimplex version
+    (noise.py reads its private permutation table and constants) and the
+    radius/seed ranges, so a bank built before any of them changed is
+    treated as stale. Raises OSError when the source can't be read.
+    """
+    # noise imports opensimplex, which is deferred like load_noise
+    from src.utils import noise
+
+    digest = hashlib.sha1()
+    digest.update(importlib.metadata.version("opensimplex").encode())
+    digest.update(inspect.getsource(noise).encode())
+    digest.update(inspect.getsource(utils.asteroid_texture_arrays).encode())
+    digest.update(repr((bank_radii(), ASTEROID_TEXTURE_SEEDS)).encode())
+    return digest.digest()
+
+
+def rgba_rows(rgb, alpha):
+    """[x, y] indexed texture arrays as row-major RGBA bytes"""
+    return np.dstack((rgb, alpha)).transpose(1, 0, 2).tobytes()
+
+
+def build_texture_bank(path=None, radii=None, seeds=None):
+    """
+    Generate every texture and pack them into one bank file.
+
+    The file is a header, an index of (radius, seed, offset) entries and
+    the RGBA rows of each texture back to back. It is written next to path
+    and moved into place at the end, so a reader never sees half a bank.
+    """
+    path = path or os.path.join(ROOT, TEXTURE_BANK_PATH)
+    radii = radii or bank_radii()
+    seeds = seeds or range(1, ASTEROID_TEXTURE_SEEDS + 1)
+    keys = [(radius, seed) for radius in radii for seed in seeds]
+
+    offset = HEADER.size + ENTRY.size * len(keys)
+    index = []
+    for radius, seed in keys:
+        index.append(ENTRY.pack(radius, seed, offset))
+        offset += (2 * radius) ** 2 * 4
+
+    partial = path + ".partial"
+    with open(partial, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, generator_fingerprint(), len(keys)))
+        f.write(b"".join(index))
+        for radius, seed in keys:
+            f.write(rgba_rows(*utils.asteroid_texture_arrays(radius, seed)))
+    os.replace(partial, path)
+    return path
+
+
+class TextureBank:
+    """
+    Read-only view of a texture bank file built by build_texture_bank.
+
+    The file is memory mapped on first use and textures are handed out as
+    surfaces wrapping the mapped bytes, nothing is copied or generated.
+    A missing, foreign or stale file just makes get() return None so
+    callers fall back to generating textures.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(ROOT, TEXTURE_BANK_PATH)
+        self.mapping = None
+        self.offsets = None  # None until opened, empty if unusable
+        self.lock = threading.Lock()  # main's warm up thread may open it
+        self.loads = 0
+        self.reason = "not opened"
+
+    def open(self):
+        offsets = {}
+        try:
+            with open(self.path, "rb") as f:
+                # copy on write, textures are never written but stay private
+                self.mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            # the fingerprint reads source files and package metadata,
+            # which can be missing just like the bank
+            self.reason = self._check()
+        except (OSError, ValueError, ImportError) as error:
+            self.reason = f"unavailable: {error}"
+            self.offsets = offsets
+            return
+
+        if self.reason == "ok":
+            _, _, _, count = HEADER.unpack_from(self.mapping)
+            for radius, seed, offset in ENTRY.iter_unpack(
+                self.mapping[HEADER.size : HEADER.size + ENTRY.size * count]
+            ):
+                offsets[(radius, seed)] = offset
+        # published last, get() never sees a half filled index
+        self.offsets = offsets
+
+    def _check(self):
+        if len(self.mapping) < HEADER.size:
+            return "truncated"
+        magic, version, fingerprint, _ = HEADER.unpack_from(self.mapping)
+        if magic != MAGIC or version != VERSION:
+            return f"not a version {VERSION} texture bank"
+        if fingerprint != generator_fingerprint():
+            return "stale, texture generation changed since it was built"
+        return "ok"
+
+    def ensure_open(self):
+        with self.lock:
+            if self.offsets is None:
+                self.open()
+
+    def get(self, radius, seed):
+        """Texture surface backed by the bank, None if it isn't in there"""
+        if self.offsets is None:
+            self.ensure_open()
+        offset = self.offsets.get((radius, seed))
+        if offset is None:
+            return None
+
+        size = 2 * radius
+        pixels = memoryview(self.mapping)[offset : offset + size * size * 4]
+        self.loads += 1
+        return pygame.image.frombuffer(pixels, (size, size), "RGBA")
+
+    def stats(self):
+        return {
+            "path": self.path,
+            "status": self.reason,
+            "entries": len(self.offsets or ()),
+            "loads": self.loads,
+        }
+
+
+# process-wide bank, opened by the first texture lookup
+texture_bank = TextureBank()
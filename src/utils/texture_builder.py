@@ -0,0 +1,110 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from src.utils.constants import TEXTURE_BUILDER_QUEUE, TEXTURE_BUILDER_WORKERS
+from src.utils.utils import asteroid_texture_arrays, deform_texture
+
+
+def build_asteroid_arrays(
+    radius, seed, radiuses, texture=None, texture_scale=1.0, warp_scale=1.0
+):
+    """
+    Texture and deformed pixel arrays for one asteroid, runs on a worker.
+
+    texture_scale is handed back too, so whoever collects the result
+    knows what detail a generated texture was built at.
+    """
+    if texture is None:
+        texture = asteroid_texture_arrays(radius, seed, texture_scale)
+    deformed = deform_texture(*texture, radius, radiuses, warp_scale)
+    return texture, deformed, texture_scale
+
+
+class TextureBuilder:
+    """
+    Builds asteroid pixel arrays on a small thread pool.
+
+    Workers only run numpy code (which releases the GIL for the heavy
+    array ops) and hand back plain arrays, turning them into surfaces is
+    left to the main thread. At most max_pending builds are in flight,
+    submit() returns None beyond that and the caller retries later.
+    """
+
+    def __init__(
+        self, workers=TEXTURE_BUILDER_WORKERS, max_pending=TEXTURE_BUILDER_QUEUE
+    ):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.executor = None  # started by the first submit
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.peak_pending = 0
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.latencies = deque(maxlen=256)  # seconds from submit to done
+
+    def full(self):
+        return self.pending >= self.max_pending
+
+    def submit(
+        self, radius, seed, radiuses, texture=None, texture_scale=1.0, warp_scale=1.0
+    ):
+        """Future for build_asteroid_arrays' result, None if the queue is full"""
+        with self.lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                return None
+            self.pending += 1
+            self.peak_pending = max(self.peak_pending, self.pending)
+            self.submitted += 1
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                self.workers, thread_name_prefix="texture-builder"
+            )
+        start = time.perf_counter()
+        future = self.executor.submit(
+            build_asteroid_arrays,
+            radius,
+            seed,
+            radiuses,
+            texture,
+            texture_scale,
+            warp_scale,
+        )
+        future.add_done_callback(lambda _: self._done(start))
+        return future
+
+    def _done(self, start):
+        with self.lock:
+            self.pending -= 1
+            self.completed += 1
+            self.latencies.append(time.perf_counter() - start)
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def stats(self):
+        latencies = np.array(self.latencies) * 1000
+        p50, p95 = np.percentile(latencies, [50, 95]) if len(latencies) else (0, 0)
+        return {
+            "queue_depth": self.pending,
+            "peak_queue_depth": self.peak_pending,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "latency_p50_ms": float(p50),
+            "latency_p95_ms": float(p95),
+        }
+
+
+# process-wide builder, used for the startup first wave and when
+# ASYNC_TEXTURES is on
+texture_builder = TextureBuilder()
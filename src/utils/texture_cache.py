@@ -0,0 +1,134 @@
+from collections import OrderedDict
+
+from src.utils.constants import (
+    ASTEROID_KINDS,
+    ASTEROID_MIN_RADIUS,
+    ASTEROID_TEXTURE_SEEDS,
+    TEXTURE_BANK,
+    TEXTURE_CACHE_BUDGET,
+)
+from src.utils.texture_bank import texture_bank
+from src.utils.utils import generate_asteroid_texture
+
+
+class TextureCache:
+    """
+    LRU cache of asteroid textures keyed by (radius, seed).
+
+    Textures only depend on radius and seed, so once one is built it can be
+    shared by every asteroid that rolls the same pair. Entries are evicted
+    least recently used first once their total size goes over the budget.
+    Cached surfaces are shared and must be treated as read-only.
+
+    Misses are served from bank (see texture_bank) when it has the texture,
+    only textures missing from the bank are generated.
+    """
+
+    def __init__(self, budget=TEXTURE_CACHE_BUDGET, bank=None):
+        self.budget = budget  # bytes
+        self.bank = bank
+        self.bank_loads = 0
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, radius, seed, scale=1.0):
+        """Texture for radius and seed, generated at scale if it has to be"""
+        texture = self.lookup(radius, seed, scale)
+        if texture is None:
+            texture = generate_asteroid_texture(radius, seed, scale)
+            self._store(self._key(radius, seed, scale), texture)
+        return texture
+
+    def lookup(self, radius, seed, scale=1.0):
+        """
+        Cached or banked texture, None if it would have to be generated.
+
+        A full detail texture is preferred, one built at scale is only used
+        when there is none. Low detail textures are cached under their own
+        key so they never stand in for full detail lookups.
+        """
+        key = (radius, seed)
+        texture = self.entries.get(key)
+        if texture is None and scale != 1:
+            key = self._key(radius, seed, scale)
+            texture = self.entries.get(key)
+        if texture is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return texture
+
+        self.misses += 1
+        return self._from_bank(radius, seed)
+
+    def _from_bank(self, radius, seed):
+        texture = self.bank.get(radius, seed) if self.bank is not None else None
+        if texture is not None:
+            self.bank_loads += 1
+            self._store((radius, seed), texture)
+        return texture
+
+    def add(self, radius, seed, texture, scale=1.0):
+        """Store a texture built elsewhere, returns the one to share"""
+        key = self._key(radius, seed, scale)
+        if key in self.entries:
+            return self.entries[key]
+        self._store(key, texture)
+        return texture
+
+    @staticmethod
+    def _key(radius, seed, scale):
+        return (radius, seed) if scale == 1 else (radius, seed, scale)
+
+    def _store(self, key, texture):
+        nbytes = texture.get_width() * texture.get_height() * texture.get_bytesize()
+        if nbytes > self.budget:
+            return
+
+        self.entries[key] = texture
+        self.size += nbytes
+        while self.size > self.budget:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= (
+                evicted.get_width() * evicted.get_height() * evicted.get_bytesize()
+            )
+            self.evictions += 1
+
+    def prewarm(self, radii=None, seeds=None):
+        """Build textures ahead of time, defaults to every radius and seed"""
+        if radii is None:
+            radii = [
+                ASTEROID_MIN_RADIUS * kind for kind in range(1, ASTEROID_KINDS + 1)
+            ]
+        if seeds is None:
+            seeds = range(1, ASTEROID_TEXTURE_SEEDS + 1)
+
+        for radius in radii:
+            for seed in seeds:
+                key = (radius, seed)
+                if key in self.entries or self._from_bank(radius, seed):
+                    continue
+                self._store(key, generate_asteroid_texture(radius, seed=seed))
+
+    def clear(self):
+        self.entries.clear()
+        self.size = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "bytes": self.size,
+            "budget": self.budget,
+            "hits": self.hits,
+            "misses": self.misses,
+            "bank_loads": self.bank_loads,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# process-wide cache shared by all asteroids
+texture_cache = TextureCache(bank=texture_bank if TEXTURE_BANK else None)
@@ -1,9 +1,41 @@
 import numpy as np
 import pygame
-from opensimplex import OpenSimplex
 
 
-def generate_asteroid_texture(radius, seed=None):
+def load_noise():
+    """
+    Import opensimplex and the noise kernel.
+
+    Deferred until the first texture is generated so startup doesn't pay
+    for it, main's warm up thread calls this early in the background.
+    """
+    from opensimplex import OpenSimplex
+
+    from src.utils.noise import noise2_array
+
+    return OpenSimplex, noise2_array
+
+
+def surface_from_arrays(rgb, alpha, surface=None):
+    """
+    SRCALPHA surface from [x, y] indexed rgb and alpha arrays.
+
+    Writes into surface instead of a new one when given, it must be an
+    SRCALPHA surface of the arrays' size.
+    """
+    if surface is None:
+        surface = pygame.Surface(alpha.shape, pygame.SRCALPHA)
+    pygame.surfarray.pixels3d(surface)[...] = rgb
+    pygame.surfarray.pixels_alpha(surface)[...] = alpha
+    return surface
+
+
+def generate_asteroid_texture(radius, seed=None, scale=1.0):
+    """Asteroid texture surface, see asteroid_texture_arrays"""
+    return surface_from_arrays(*asteroid_texture_arrays(radius, seed, scale))
+
+
+def asteroid_texture_arrays(radius, seed=None, scale=1.0):
     """
     Generate a smooth, natural-looking asteroid texture using noise
 
@@ -11,51 +43,126 @@ def generate_asteroid_texture(radius, seed=None):
     2.) Create fractal noise patterns with noise gen.
     3.) Normalize noise, enhance contrast, create gray variation.
     4.) Edge smoothing.
+
+    Every step works on whole pixel arrays. Returns rgb and alpha uint8
+    arrays indexed [x, y] like surfarray; no pygame calls are made, so
+    this is safe to run off the main thread.
+
+    A scale below 1 only generates that fraction of the pixels per side
+    and stretches them back to full size, a cheaper low detail texture.
     """
     size = int(radius * 2)
-    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    samples = max(round(size * scale), 1)
+    step = size / samples  # pixels per generated sample
+    rgb = np.zeros((samples, samples, 3), dtype=np.uint8)
+    alphas = np.zeros((samples, samples), dtype=np.uint8)
 
+    OpenSimplex, noise2_array = load_noise()
     noise_gen = OpenSimplex(seed=seed)
 
-    # Create base circular mask
+    # Create base circular mask, arrays are indexed [x, y] like surfarray
     center = radius
-    for x in range(size):
-        for y in range(size):
-            dx = x - center
-            dy = y - center
-            distance = np.sqrt(dx * dx + dy * dy)
-
-            if distance < radius:
-                # Generate multiple layers of noise for more detail
-                noise_val = 0
-                amplitude = 1.0
-                frequency = 1.0
-
-                for _ in range(4):  # Use 4 octaves of noise
-                    noise_val += amplitude * noise_gen.noise2(
-                        x * frequency * 0.1, y * frequency * 0.1
-                    )
-                    amplitude *= 0.5
-                    frequency *= 2
-
-                # Normalize noise to 0-1 range and enhance contrast
-                noise_val = (noise_val + 1) * 0.5
-                noise_val = noise_val * 0.8 + 0.2
-
-                # Create more varied color gradient
-                base_color = 64
-                color_range = 160
-                color_val = int(base_color + noise_val * color_range)
-
-                # Smoother edge falloff that preserves texture
-                edge_distance = distance / radius
-                if edge_distance < 0.8:  # sharp opacity
-                    alpha = 255
-                else:
-                    alpha = int(
-                        255 * (1.0 - (edge_distance - 0.8) / 0.2)
-                    )  # gradual transparency fade
-
-                surface.set_at((x, y), (color_val, color_val, color_val, alpha))
+    ix, iy = np.meshgrid(np.arange(samples), np.arange(samples), indexing="ij")
+    dx = ix * step - center
+    dy = iy * step - center
+    distance = np.sqrt(dx * dx + dy * dy)
+    mask = distance < radius
 
-    return surface
+    ix = ix[mask]
+    iy = iy[mask]
+    distance = distance[mask]
+    # noise is sampled at pixel coordinates, so it looks the same at any scale
+    xs = ix * step
+    ys = iy * step
+
+    # Generate multiple layers of noise for more detail
+    noise_val = np.zeros(distance.shape)
+    amplitude = 1.0
+    frequency = 1.0
+
+    for _ in range(4):  # Use 4 octaves of noise
+        noise_val += amplitude * noise2_array(
+            noise_gen, xs * frequency * 0.1, ys * frequency * 0.1
+        )
+        amplitude *= 0.5
+        frequency *= 2
+
+    # Normalize noise to 0-1 range and enhance contrast
+    noise_val = (noise_val + 1) * 0.5
+    noise_val = noise_val * 0.8 + 0.2
+
+    # Create more varied color gradient
+    base_color = 64
+    color_range = 160
+    color_val = (base_color + noise_val * color_range).astype(np.int64)
+
+    # Smoother edge falloff that preserves texture
+    edge_distance = distance / radius
+    alpha = np.where(
+        edge_distance < 0.8,  # sharp opacity
+        255,
+        (255 * (1.0 - (edge_distance - 0.8) / 0.2)).astype(np.int64),
+    )  # gradual transparency fade
+
+    rgb[ix, iy] = color_val[:, np.newaxis]
+    alphas[ix, iy] = alpha
+    return stretch(rgb, size), stretch(alphas, size)
+
+
+def stretch(pixels, size):
+    """Nearest neighbour resize of an [x, y] indexed square array to size a side"""
+    if len(pixels) == size:
+        return pixels
+    index = np.arange(size) * len(pixels) // size
+    return pixels[index][:, index]
+
+
+def deform_texture(rgb, alpha, radius, radiuses, scale=1.0):
+    """
+    Warp a round texture into an asteroid's bumpy outline.
+
+    radiuses holds the outline radius in one degree steps. Takes and
+    returns [x, y] indexed rgb and alpha arrays and, like
+    asteroid_texture_arrays, never touches pygame. A scale below 1 warps
+    fewer pixels per side and stretches the result back to full size.
+    """
+    # important to make asteroid slightly bigger, else
+    # surface interpolation cannot be done, and you will
+    # have square asteroids :(
+    size = int(radius * 2.4)
+    samples = max(round(size * scale), 1)
+    step = size / samples  # pixels per warped sample
+    deformed_rgb = np.zeros((samples, samples, 3), dtype=np.uint8)
+    deformed_alpha = np.zeros((samples, samples), dtype=np.uint8)
+    center = size / 2
+
+    # pixel positions relative to center, indexed [x, y] like surfarray
+    xx, yy = np.meshgrid(np.arange(samples), np.arange(samples), indexing="ij")
+    pos_x = xx * step - center
+    pos_y = yy * step - center
+    distances = np.sqrt(pos_x**2 + pos_y**2)
+    angles = np.arctan2(pos_y, pos_x) % (2 * np.pi)
+
+    # Map angles to pre-calculated radiuses
+    angle_indices = (angles * 180 / np.pi).astype(int) % 360
+    varied_radiuses = radiuses[angle_indices]
+
+    # Create mask for valid pixels
+    mask = distances <= varied_radiuses
+    dst_x = xx[mask]
+    dst_y = yy[mask]
+
+    # squash each pixel back onto the round texture
+    ratio = distances[mask] / varied_radiuses[mask]
+    src_x = (pos_x[mask] * ratio + radius).astype(int)
+    src_y = (pos_y[mask] * ratio + radius).astype(int)
+
+    width, height = alpha.shape
+    valid = (0 <= src_x) & (src_x < width) & (0 <= src_y) & (src_y < height)
+    dst_x, dst_y = dst_x[valid], dst_y[valid]
+    src_x, src_y = src_x[valid], src_y[valid]
+
+    # single gather from the texture arrays
+    deformed_rgb[dst_x, dst_y] = rgb[src_x, src_y]
+    deformed_alpha[dst_x, dst_y] = alpha[src_x, src_y]
+    return stretch(deformed_rgb, size), stretch(deformed_alpha, size)
@@ -0,0 +1,42 @@
+"""Constant overrides reach everything a batch game builds"""
+
+import pytest
+
+from src.core import asteroid_field, simulation
+from src.core.batch import apply_overrides, game_configs, run_game
+
+
+def play(overrides):
+    outcome = run_game({"seed": 3, "max_seconds": 60, "overrides": overrides})
+    return outcome["score"], outcome["peak_entities"]
+
+
+def test_lifetime_policy_override_changes_the_game():
+    # the policy used to be bound as AsteroidField's default argument
+    wrap = play({"ASTEROID_LIFETIME_POLICY": "wrap"})
+    despawn = play({"ASTEROID_LIFETIME_POLICY": "despawn"})
+    assert wrap != despawn
+    assert asteroid_field.ASTEROID_LIFETIME_POLICY == "wrap"
+
+
+def test_import_time_constant_is_rejected():
+    with pytest.raises(ValueError, match="ROTATION_MODE"):
+        apply_overrides({"ROTATION_MODE": "atlas"})
+
+
+def test_bad_name_leaves_nothing_applied():
+    with pytest.raises(ValueError, match="unknown constant"):
+        apply_overrides({"COLLISION_MODE": "brute", "NOT_A_CONSTANT": 1})
+    assert simulation.COLLISION_MODE == "grid"
+
+
+@pytest.mark.parametrize("seconds", (0, 0.001, -1))
+def test_game_configs_rejects_runs_shorter_than_a_tick(seconds):
+    with pytest.raises(ValueError, match="one tick"):
+        game_configs(2, max_seconds=seconds)
+
+
+def test_game_without_ticks_has_no_tick_times():
+    outcome = run_game({"seed": 1, "max_seconds": 0, "overrides": {}})
+    assert outcome["ticks"] == 0
+    assert outcome["tick_p50_ms"] is None
@@ -0,0 +1,28 @@
+"""Every collision mode resolves a tick the same way, deaths included"""
+
+from src.core.batch import apply_overrides, restore_overrides
+from src.core.controls import ScriptedInput, spin_and_fire
+from src.core.replay import state_digest
+from src.core.simulation import Simulation
+
+MODES = ("brute", "grid", "kernel")
+
+
+def play(mode, seed, seconds):
+    previous = apply_overrides({"COLLISION_MODE": mode})
+    try:
+        sim = Simulation(ScriptedInput(spin_and_fire), seed=seed)
+        assert sim.broad_phase.mode == mode
+        game_overs = sim.run(seconds)
+    finally:
+        restore_overrides(previous)
+    return game_overs, sim.game_state.player.score, state_digest(sim)
+
+
+def test_modes_agree_through_game_overs():
+    # with the player and shot hits applied in a different order per mode,
+    # kernel and grid ended seed 3 in different states within 90 seconds
+    outcomes = {mode: play(mode, seed=3, seconds=90) for mode in MODES}
+    game_overs, _, _ = outcomes["grid"]
+    assert game_overs > 0
+    assert outcomes["brute"] == outcomes["grid"] == outcomes["kernel"]
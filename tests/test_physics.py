@@ -0,0 +1,93 @@
+"""Asteroid bounces, and their sweep and prune broad phase"""
+
+import random
+
+import numpy as np
+import pygame
+import pytest
+
+from src.core.circleshape import CircleShape
+from src.core.collisions import SweepAndPrune, overlap_pairs, positions_and_radii
+from src.core.physics import AsteroidPhysics
+
+
+def body(x, y, radius, velocity=(0, 0)):
+    shape = CircleShape(x, y, radius)
+    shape.velocity = pygame.Vector2(velocity)
+    return shape
+
+
+def crowd(count, seed):
+    """Asteroids packed densely enough for plenty of contacts"""
+    rng = random.Random(seed)
+    return [
+        body(
+            rng.uniform(0, 600),
+            rng.uniform(0, 400),
+            rng.choice((10, 20, 30)),
+            pygame.Vector2(rng.uniform(40, 100), 0).rotate(rng.uniform(0, 360)),
+        )
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_sweep_and_prune_matches_all_pairs(seed):
+    asteroids = crowd(300, seed)
+    broad_phase = SweepAndPrune()
+    for _ in range(3):
+        sprites, positions, radii = broad_phase.update(asteroids)
+        first, second = broad_phase.pairs(positions, radii)
+        distance = np.hypot(*(positions[first] - positions[second]).T)
+        touching = distance <= radii[first] + radii[second]
+        found = {
+            frozenset((sprites[i], sprites[j]))
+            for i, j in zip(first[touching].tolist(), second[touching].tolist())
+        }
+
+        positions, radii = positions_and_radii(asteroids)
+        expected = {
+            frozenset((asteroids[i], asteroids[j]))
+            for i, j in overlap_pairs(positions, radii, positions, radii).tolist()
+            if i < j
+        }
+        assert found == expected
+        # keep the order from the last frame, like the game does
+        for asteroid in asteroids:
+            asteroid.position += asteroid.velocity / 60
+
+
+def test_separating_pair_gets_no_impulse():
+    a = body(100, 100, 20, (-50, 0))
+    b = body(130, 100, 20, (50, 0))
+    physics = AsteroidPhysics()
+    physics.step([a, b])
+    assert physics.contacts == 0
+    assert a.velocity == (-50, 0) and b.velocity == (50, 0)
+    assert a.position == (100, 100) and b.position == (130, 100)
+
+
+def test_approaching_pair_bounces_apart():
+    a = body(100, 100, 20, (50, 0))
+    b = body(130, 100, 10, (-50, 0))
+    AsteroidPhysics().step([a, b])
+    assert a.velocity.x < 0 < b.velocity.x
+    assert a.position.distance_to(b.position) == pytest.approx(30)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_momentum_is_conserved(seed):
+    # mass is proportional to radius
+    asteroids = crowd(300, seed)
+
+    def momentum():
+        return sum(
+            (asteroid.velocity * asteroid.radius for asteroid in asteroids),
+            pygame.Vector2(),
+        )
+
+    before = momentum()
+    physics = AsteroidPhysics()
+    physics.step(asteroids)
+    assert physics.contacts > 0
+    assert momentum().distance_to(before) < 1e-6 * max(before.length(), 1)
@@ -0,0 +1,88 @@
+"""The quality governor steps detail down and up from whole windows of frames"""
+
+import pygame
+
+from src.utils.constants import ASTEROID_MIN_RADIUS
+from src.utils.quality_governor import LEVELS, QualityGovernor
+from src.utils.texture_cache import TextureCache
+
+BUDGET = 0.010
+
+
+def governor(**kwargs):
+    return QualityGovernor(
+        **{"budget": BUDGET, "window": 5, "raise_below": 0.6, "pinned": None, **kwargs}
+    )
+
+
+def feed(governor, seconds, frames):
+    for _ in range(frames):
+        governor.frame(seconds)
+
+
+def test_drops_only_after_a_full_window_over_budget():
+    quality = governor()
+    feed(quality, 2 * BUDGET, 4)
+    assert quality.index == 0
+
+    quality.frame(2 * BUDGET)
+    assert quality.index == 1
+    assert quality.level is LEVELS[1]
+    assert quality.decisions[-1][:3] == (5, 0, 1)
+
+
+def test_window_is_refilled_after_each_change():
+    quality = governor()
+    feed(quality, 2 * BUDGET, 5)
+    assert quality.index == 1
+
+    # the frames before the change don't count towards the next one
+    feed(quality, 2 * BUDGET, 4)
+    assert quality.index == 1
+    quality.frame(2 * BUDGET)
+    assert quality.index == 2
+
+
+def test_rises_only_below_raise_below_of_the_budget():
+    quality = governor()
+    feed(quality, 2 * BUDGET, 5)
+    assert quality.index == 1
+
+    # under budget but above raise_below of it, stays put
+    feed(quality, 0.8 * BUDGET, 20)
+    assert quality.index == 1
+
+    feed(quality, 0.5 * BUDGET, 5)
+    assert quality.index == 0
+    assert quality.stats()["steps_up"] == 1
+
+
+def test_never_goes_past_the_cheapest_level():
+    quality = governor()
+    feed(quality, 2 * BUDGET, 5 * (len(LEVELS) + 2))
+    assert quality.index == len(LEVELS) - 1
+
+
+def test_pinned_level_never_moves():
+    quality = governor(pinned=2)
+    feed(quality, 10 * BUDGET, 20)
+    feed(quality, 0.1 * BUDGET, 20)
+    assert quality.index == 2
+    assert quality.decisions == []
+    assert quality.frames == 40
+
+
+def test_scaled_textures_never_stand_in_for_full_detail():
+    cache = TextureCache(bank=None)
+    radius, seed = ASTEROID_MIN_RADIUS, 1
+    low = pygame.Surface((radius, radius), pygame.SRCALPHA)
+    cache.add(radius, seed, low, scale=0.5)
+
+    assert cache.lookup(radius, seed) is None
+    assert cache.lookup(radius, seed, 0.5) is low
+
+    # once a full detail one is in, scaled lookups prefer it
+    full = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+    cache.add(radius, seed, full)
+    assert cache.lookup(radius, seed) is full
+    assert cache.lookup(radius, seed, 0.5) is full
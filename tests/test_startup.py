@@ -0,0 +1,28 @@
+"""The startup first wave builds in the background without touching globals"""
+
+from src.core.asteroid import Asteroid
+from src.core.startup import Startup
+
+
+def test_first_wave_only_covers_the_first_asteroids(monkeypatch):
+    monkeypatch.setattr(Asteroid, "async_textures", False)
+    monkeypatch.setattr(Asteroid, "async_first_wave", 0)
+    Startup(0.0, first_wave=2).begin()
+
+    asteroids = [Asteroid(100, 100, 40) for _ in range(3)]
+
+    assert [asteroid.async_build for asteroid in asteroids] == [True, True, False]
+    assert Asteroid.async_textures is False
+    assert Asteroid.async_first_wave == 0
+
+
+def test_first_wave_leaves_async_textures_on(monkeypatch):
+    monkeypatch.setattr(Asteroid, "async_textures", True)
+    monkeypatch.setattr(Asteroid, "async_first_wave", 0)
+    Startup(0.0, first_wave=2).begin()
+
+    asteroid = Asteroid(100, 100, 40)
+
+    assert asteroid.async_build
+    # async asteroids don't use up the wave
+    assert Asteroid.async_first_wave == 2
@@ -0,0 +1,124 @@
+"""Swept shot collisions stepped through a whole Simulation at long ticks"""
+
+import pygame
+import pytest
+
+from src.core import simulation
+from src.core.asteroid import Asteroid
+from src.core.controls import InputState, ScriptedInput, spin_and_fire
+from src.core.simulation import Simulation
+from src.utils.constants import PLAYER_SHOT_SPEED, SCREEN_HEIGHT, SCREEN_WIDTH
+
+TIMESTEPS = (1 / 15, 1 / 5)
+
+
+def shooting_range(dt, target_x, start_x=SCREEN_WIDTH / 2):
+    """
+    Simulation whose player fires one shot to the right at a still asteroid.
+
+    The player stands at start_x, the asteroid field is removed so nothing
+    else spawns and the target is the smallest asteroid, centered on the
+    shot's path at target_x.
+    """
+    # fire on the first tick only
+    sim = Simulation(
+        ScriptedInput([InputState(fire=True)], loop=False), timestep=dt, seed=0
+    )
+    sim.asteroid_field.kill()
+    player = sim.game_state.player
+    player.angle = 90  # shots fly along +x
+    player.position = pygame.Vector2(start_x, player.position.y)
+    target = Asteroid(target_x, player.position.y, 10)
+    target.velocity = pygame.Vector2(0, 0)
+    return sim, target
+
+
+def run(sim, seconds):
+    for _ in range(round(seconds / sim.timestep)):
+        sim.step(sim.timestep)
+
+
+@pytest.fixture(params=(False, True), ids=("sprites", "world"))
+def continuous(request, monkeypatch):
+    monkeypatch.setattr(simulation, "CONTINUOUS_COLLISIONS", True)
+    monkeypatch.setattr(simulation, "WORLD_BACKEND", request.param)
+
+
+@pytest.mark.parametrize("dt", TIMESTEPS, ids=("1/15", "1/5"))
+@pytest.mark.parametrize("target_x", (700, 900, 1100))
+def test_shot_hits_small_asteroid(continuous, dt, target_x):
+    sim, target = shooting_range(dt, target_x)
+    run(sim, 2)
+    assert not target.alive()
+    assert sim.game_state.player.score == 25
+    assert len(sim.sprite_groups["shot_group"]) == 0
+
+
+@pytest.mark.parametrize("dt", TIMESTEPS, ids=("1/15", "1/5"))
+def test_shot_hits_asteroid_it_passes_leaving_the_screen(continuous, dt):
+    # the shot's last position on screen is 0.9 of a tick's travel before
+    # the edge, during the next tick it crosses the asteroid and leaves.
+    # Both positions are half a tick's travel from the asteroid, too far
+    # for an overlap test to see the hit
+    travel = PLAYER_SHOT_SPEED * dt
+    start_x = SCREEN_WIDTH - 0.9 * travel - 5 * travel
+    sim, target = shooting_range(dt, SCREEN_WIDTH - 0.4 * travel, start_x)
+    run(sim, 2)
+    assert not target.alive()
+    assert sim.game_state.player.score == 25
+
+
+@pytest.mark.parametrize("dt", TIMESTEPS, ids=("1/15", "1/5"))
+def test_missed_shot_is_removed_off_screen(continuous, dt):
+    sim, target = shooting_range(dt, SCREEN_WIDTH / 2 + 100)
+    target.position = pygame.Vector2(target.position.x, SCREEN_HEIGHT - 10)
+    run(sim, 2)
+    assert target.alive()
+    assert sim.game_state.player.score == 0
+    assert len(sim.sprite_groups["shot_group"]) == 0
+
+
+@pytest.mark.parametrize("dt", TIMESTEPS, ids=("1/15", "1/5"))
+def test_overlap_test_misses_small_asteroid(monkeypatch, dt):
+    # the case the swept pass exists for, a shot tunnels through at long ticks
+    monkeypatch.setattr(simulation, "CONTINUOUS_COLLISIONS", False)
+    target_x = SCREEN_WIDTH / 2 + PLAYER_SHOT_SPEED * dt * 2.5
+    sim, target = shooting_range(dt, target_x)
+    run(sim, 2)
+    assert target.alive()
+
+
+def test_swept_pass_sees_the_path_asteroids_moved(monkeypatch):
+    # with physics and the swept pass on, every asteroid the swept pass
+    # looks at must have come from position - velocity * dt this tick
+    monkeypatch.setattr(simulation, "ASTEROID_PHYSICS", True)
+    monkeypatch.setattr(simulation, "CONTINUOUS_COLLISIONS", True)
+    dt = 1 / 15
+    sim = Simulation(ScriptedInput(spin_and_fire), timestep=dt, seed=3)
+    starts = {}
+    errors = []
+    contacts = 0
+    sweep = simulation.resolve_collisions_swept
+
+    def checked_sweep(game_state, broad_phase, dt):
+        for asteroid in game_state.sprite_groups["asteroid_group"]:
+            start = starts.get(asteroid)
+            # skip new asteroids and ones wrapped around the screen
+            if start is None or start.distance_to(asteroid.position) > 200:
+                continue
+            errors.append(
+                (asteroid.position - asteroid.velocity * dt).distance_to(start)
+            )
+        return sweep(game_state, broad_phase, dt)
+
+    monkeypatch.setattr(simulation, "resolve_collisions_swept", checked_sweep)
+    for _ in range(round(40 / dt)):
+        starts = {
+            asteroid: pygame.Vector2(asteroid.position)
+            for asteroid in sim.sprite_groups["asteroid_group"]
+        }
+        if sim.step(dt):
+            sim.game_state.reset_game()
+        contacts += sim.physics.contacts
+    assert contacts > 0
+    assert max(errors) < 1e-6
@@ -0,0 +1,42 @@
+"""Texture banks are only used when they match the texture generator"""
+
+import pytest
+
+from src.utils import texture_bank
+from src.utils.texture_bank import TextureBank, build_texture_bank
+
+
+@pytest.fixture
+def bank_path(tmp_path):
+    path = str(tmp_path / "textures.bank")
+    return build_texture_bank(path, radii=[10], seeds=[1, 2])
+
+
+def test_matching_bank_serves_textures(bank_path):
+    bank = TextureBank(bank_path)
+    assert bank.get(10, 2).get_size() == (20, 20)
+    assert bank.get(20, 1) is None
+    assert bank.stats()["status"] == "ok"
+
+
+def test_stale_bank_is_ignored(bank_path, monkeypatch):
+    monkeypatch.setattr(texture_bank, "generator_fingerprint", lambda: b"\0" * 20)
+    bank = TextureBank(bank_path)
+    assert bank.get(10, 1) is None
+    assert bank.stats()["status"].startswith("stale")
+
+
+def test_unreadable_generator_source_falls_back(bank_path, monkeypatch):
+    def fingerprint():
+        raise OSError("could not get source code")
+
+    monkeypatch.setattr(texture_bank, "generator_fingerprint", fingerprint)
+    bank = TextureBank(bank_path)
+    assert bank.get(10, 1) is None
+    assert bank.stats()["status"].startswith("unavailable")
+
+
+def test_missing_bank_falls_back(tmp_path):
+    bank = TextureBank(str(tmp_path / "missing.bank"))
+    assert bank.get(10, 1) is None
+    assert bank.stats()["status"].startswith("unavailable")
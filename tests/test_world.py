@@ -0,0 +1,71 @@
+"""The World backend plays the same game as per sprite updates"""
+
+import pygame
+import pytest
+
+from src.core.asteroid import Asteroid
+from src.core.batch import apply_overrides, restore_overrides
+from src.core.controls import ScriptedInput, spin_and_fire
+from src.core.replay import state_digest
+from src.core.simulation import Simulation
+from src.core.world import World
+
+
+def digest(overrides, seed=3, seconds=40):
+    previous = apply_overrides(overrides)
+    try:
+        sim = Simulation(ScriptedInput(spin_and_fire), seed=seed)
+        sim.run(seconds)
+    finally:
+        restore_overrides(previous)
+    return state_digest(sim)
+
+
+@pytest.mark.parametrize(
+    "flags",
+    (
+        {},
+        # bounces make a one tick difference in wrapping visible
+        {"ASTEROID_PHYSICS": True},
+        {"ASTEROID_LIFETIME_POLICY": "despawn"},
+    ),
+    ids=("default", "physics", "despawn"),
+)
+def test_world_matches_sprites(flags):
+    sprites = digest({**flags, "WORLD_BACKEND": False})
+    world = digest({**flags, "WORLD_BACKEND": True})
+    assert world == sprites
+
+
+def test_detached_sprite_keeps_its_class_and_values(monkeypatch):
+    world = World()
+    monkeypatch.setattr(Asteroid, "world", world)
+    asteroid = Asteroid(100, 200, 20)
+    asteroid.velocity = pygame.Vector2(30, 0)
+    assert type(asteroid) is Asteroid
+    assert asteroid.world_slot is not None
+    world.step(1)
+    assert asteroid.position == (130, 200)
+
+    world.detach(asteroid)
+    world.detach(asteroid)  # a second detach does nothing
+    assert type(asteroid) is Asteroid
+    assert asteroid.world_slot is None
+    assert world.count() == 0
+    assert asteroid.position == (130, 200)
+    assert asteroid.velocity == (30, 0)
+    asteroid.update(1)
+    assert asteroid.position == (160, 200)
+
+
+def test_subclass_of_a_world_body_attaches_and_detaches(monkeypatch):
+    class Marked(Asteroid):
+        pass
+
+    world = World()
+    monkeypatch.setattr(Asteroid, "world", world)
+    marked = Marked(10, 10, 10)
+    assert marked.world_slot is not None
+    world.detach(marked)
+    assert type(marked) is Marked
+    assert marked.position == (10, 10)